@@ -8,18 +8,111 @@ Network failures or parsing misses leave the existing title unchanged.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import lru_cache
+from html import unescape as _unescape_html
+from html.parser import HTMLParser
+from types import MappingProxyType
+from typing import Callable, List, Dict, Mapping, Optional, Tuple
 import os
+import re
+import string
+import sys
+from pathlib import Path
+import threading
 import requests
-from bs4 import BeautifulSoup  # type: ignore
-try:  # optional dependency for Markdown conversion
-    from markdownify import markdownify as _md
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
+import soupsieve as sv  # type: ignore
+try:  # prefer the C-backed lxml tree builder; html.parser is the pure-Python fallback
+    from lxml import etree as _lxml_etree  # type: ignore
+    _HTML_PARSER = "lxml"
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
-    _md = None  # type: ignore
+    _lxml_etree = None  # type: ignore
+    _HTML_PARSER = "html.parser"
+try:  # optional C-backed CSS engine for single-node lookups (no Python DOM)
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+    LexborHTMLParser = None  # type: ignore
 
 
 DEFAULT_TIMEOUT = 15
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60  # seconds an on-disk page response stays fresh
+
+# Fast path for the common flat <div class="... event-subtitle ...">text</div> markup.
+# Attribute values are matched as whole quoted tokens so a ">" or "class" inside
+# another attribute (title="a>b", data-class="...") cannot end or start a match.
+_ATTRS = r"""(?:[^>"']|"[^"]*"|'[^']*')*?"""
+_SUBTITLE_RE = re.compile(
+    r"<div(?=[\s/>])" + _ATTRS + r"\sclass\s*=\s*"
+    r"""(?:"[^"]*?(?<![\w-])event-subtitle(?![\w-])[^"]*"|'[^']*?(?<![\w-])event-subtitle(?![\w-])[^']*'|event-subtitle(?=[\s>]))"""
+    + _ATTRS + r">(.*?)</div\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_SUBTITLE_TAG_RE = re.compile(r"</?[a-z]" + _ATTRS + ">", re.IGNORECASE)
+# Inner markup the regex cannot flatten like get_text(): nested divs, raw-text
+# elements whose contents get_text() drops, comments and CDATA sections.
+_SUBTITLE_FALLBACK_MARKERS = ("<div", "<script", "<style", "<!--", "<![cdata[")
+_TAG_RE = re.compile(r"<[^>]*>")
+# Marker filters ("<label>:", "<label>") for the abstract/bio extractors;
+# BeautifulSoup runs these with a C-level regex search per text node instead
+# of calling back into a lambda.
+_SECTION_MARKERS = {
+    label: (re.compile(f"{label}:"), re.compile(label)) for label in ("Abstract", "Bio")
+}
+# Compiled XPath for the lxml fallback (class token match, same as div.event-subtitle).
+_SUBTITLE_XPATH = (
+    _lxml_etree.XPath(
+        '//div[contains(concat(" ", normalize-space(@class), " "), " event-subtitle ")][1]'
+    )
+    if _lxml_etree is not None
+    else None
+)
+_parser_tls = threading.local()  # one reusable lxml HTMLParser per worker thread
+# Abstract/Bio marker lookups for the lxml path, evaluated in C: every text or
+# comment node containing $needle, and every h1-h6, in document order.
+_MARKER_NODES_XPATH = (
+    _lxml_etree.XPath("(//text() | //comment())[contains(., $needle)]")
+    if _lxml_etree is not None
+    else None
+)
+_HEADINGS_XPATH = (
+    _lxml_etree.XPath("//h1 | //h2 | //h3 | //h4 | //h5 | //h6") if _lxml_etree is not None else None
+)
+# Strings directly inside these are not main content for BeautifulSoup's
+# get_text(); _lxml_text skips them the same way so both paths agree.
+_STRING_CONTAINERS = frozenset({"script", "style", "template", "rt", "rp"})
+# Section markers: headings end a section; the block parent of a split "Bio:" label.
+_HEADER_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_BLOCK_TAGS = frozenset({"p", "div", "section", "article"})
+# Restricts raw-details parsing to the details containers. The class filter is
+# a token regex because the strainer sees the whole (multi-class) attribute value.
+_DETAILS_STRAINER = SoupStrainer(
+    "div", class_=re.compile(r"(?:^|\s)(?:events-detail-main|event-details-main)(?:\s|$)")
+)
+
+# CSS selectors compiled once instead of on every select_one() call. The two
+# details containers stay separate so the primary class wins wherever it sits.
+_PRIMARY_DETAILS_SEL = sv.compile("div.events-detail-main")
+_ALT_DETAILS_SEL = sv.compile("div.event-details-main")
+_DETAILS_HEADER_SEL = sv.compile(".details")
+# Body wrappers following the .details header, most specific first.
+_CONTENT_WRAPPER_CLASSES = ("tex2jax_process", "field__item", "field--name-field-ps-body")
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+# Process-wide switches and request headers, resolved once at import. The
+# headers are read-only since every request and session shares this one mapping.
+_DEBUG = os.getenv("ENRICH_DEBUG") in _TRUTHY
+_HEADERS: Mapping[str, str] = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    # Site-provided bypass header for bot protection (value optional)
+    "x-wdsoit-bot-bypass": os.getenv("BOT_BYPASS_HEADER_VALUE", "1"),
+})
 
 
 @dataclass
@@ -55,47 +148,282 @@ class RawExtractEnrichmentStats:
     errors: int = 0
 
 
-def fetch_subtitle(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
-    """Fetch a page and return normalized subtitle text.
+class _SubtitleFound(Exception):
+    """Raised by _SubtitleExtractor to stop feeding once the div is closed."""
+
+
+class _SubtitleExtractor(HTMLParser):
+    """Single-pass, DOM-free scan collecting the text of the first div.event-subtitle."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.depth = 0  # open divs inside the subtitle div; 0 = not capturing
+        self.in_raw = False  # inside <script>/<style>, whose text get_text() skips
+        self.parts: List[str] = []
+        self.found = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self.in_raw = True
+            return
+        if tag != "div":
+            return
+        if self.depth:
+            self.depth += 1
+        elif "event-subtitle" in (dict(attrs).get("class") or "").split():
+            self.depth = 1
+            self.found = True
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style"):
+            self.in_raw = False
+        elif tag == "div" and self.depth:
+            self.depth -= 1
+            if not self.depth:
+                raise _SubtitleFound
+
+    def handle_data(self, data):
+        if self.depth and not self.in_raw and data.strip():
+            self.parts.append(data.strip())
+
+
+def _lxml_parser():
+    parser = getattr(_parser_tls, "parser", None)
+    if parser is None:
+        parser = _parser_tls.parser = _lxml_etree.HTMLParser()
+    return parser
+
+
+def _subtitle_text(html: str) -> Optional[str]:
+    """Return the raw text of the first div.event-subtitle, or None if absent.
+
+    Pages that never mention the class are rejected with a substring scan.
+    A precompiled regex handles flat markup without building a DOM; nested
+    divs (or a miss) fall through to selectolax when installed, then to a compiled
+    lxml XPath, and to a stdlib HTMLParser scan when neither is available. Text nodes
+    are joined with a space so the caller only needs to collapse whitespace runs.
+    """
+    if "event-subtitle" not in html:  # plain substring scan; skip the DOM on pages without one
+        return None
+    m = _SUBTITLE_RE.search(html)
+    if m:
+        inner = m.group(1)
+        lowered = inner.lower()
+        if not any(marker in lowered for marker in _SUBTITLE_FALLBACK_MARKERS):
+            return _unescape_html(_SUBTITLE_TAG_RE.sub(" ", inner)).strip()
+    if LexborHTMLParser is not None:
+        node = LexborHTMLParser(html).css_first("div.event-subtitle")
+        if node is None:
+            return None
+        node.strip_tags(["script", "style"])  # get_text() never included their text
+        return node.text(separator=" ", strip=True)
+    if _SUBTITLE_XPATH is not None:
+        try:
+            root = _lxml_etree.fromstring(html, _lxml_parser())
+        except (ValueError, _lxml_etree.LxmlError):  # e.g. a str with an XML encoding declaration
+            root = None
+        if root is not None:
+            nodes = _SUBTITLE_XPATH(root)
+            if not nodes:
+                return None
+            _lxml_etree.strip_elements(nodes[0], "script", "style", with_tail=False)
+            return " ".join(nodes[0].itertext()).strip()
+    extractor = _SubtitleExtractor()
+    try:
+        extractor.feed(html)
+        extractor.close()
+    except _SubtitleFound:
+        pass
+    return " ".join(extractor.parts) if extractor.found else None
 
-    Adds a desktop User-Agent to avoid 403 responses and collapses internal
-    whitespace/newlines to single spaces.
+
+class _CappedRetry(Retry):
+    """Retry that honors Retry-After only up to a few seconds.
+
+    urllib3 sleeps for whatever the header asks; a server answering 429/503
+    with "Retry-After: 3600" would otherwise park every worker for an hour.
+    """
+
+    MAX_RETRY_AFTER = 5.0  # seconds
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.MAX_RETRY_AFTER)
+
+
+@lru_cache(maxsize=1)
+def _requests_cache():
+    """Optional requests-cache module, imported on first use.
+
+    Only runs with --cache-dir / ENRICH_CACHE_DIR need it, so the others skip its import cost.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        # Site-provided bypass header for bot protection (value optional)
-        "x-wdsoit-bot-bypass": os.getenv("BOT_BYPASS_HEADER_VALUE", "1"),
-    }
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
     try:
-        resp = requests.get(url, timeout=timeout, headers=headers)
+        import requests_cache  # type: ignore
+    except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+        return None
+    return requests_cache
+
+
+def _mount_retrying_adapter(session: requests.Session, pool_maxsize: int = 1, pool_block: bool = False) -> None:
+    """Mount the shared retry policy on `session` for both http and https.
+
+    Connection resets, rate limiting (honoring Retry-After up to
+    `_CappedRetry.MAX_RETRY_AFTER` seconds) and gateway hiccups are retried briefly; after that the response is returned and callers treat
+    it like any bad status. Read timeouts are not retried, so a stalled server
+    costs one timeout rather than one per attempt.
+    """
+    retries = _CappedRetry(
+        total=2, read=0, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504), raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retries, pool_block=pool_block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def build_session(
+    pool_maxsize: Optional[int] = None,
+    cache_dir: Optional[str | os.PathLike] = None,
+) -> requests.Session:
+    """Create a pooled session so event pages on one host reuse keep-alive connections.
+
+    The pool defaults to `enrichment_workers()` connections and blocks when all
+    are busy, so concurrent fetches share a fixed set of warm sockets instead of
+    opening (and discarding) extra ones.
+
+    With `cache_dir`, responses are persisted in an SQLite cache under that
+    directory (via requests-cache). Pages that carry an ETag/Last-Modified are
+    revalidated with a conditional GET on every use, so an unchanged page costs
+    a bodyless 304; pages without validators are reused for DEFAULT_CACHE_TTL.
+    Only 200 responses are stored, so failed fetches are retried on the next run
+    rather than remembered, while a page that simply lacks the markup we look for
+    is cached like any other. If revalidating a stored page fails (timeout, 5xx),
+    the stored copy is served instead of dropping the enrichment.
+
+    Callers own the session (use it as a context manager); fetchers fall back to
+    plain `requests.get` when no session is passed, which keeps them easy to stub.
+    """
+    requests_cache = _requests_cache() if cache_dir else None
+    if requests_cache is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        session: requests.Session = requests_cache.CachedSession(
+            str(Path(cache_dir) / "enrich_pages"),
+            backend="sqlite",
+            expire_after=DEFAULT_CACHE_TTL,
+            allowable_codes=(200,),
+            always_revalidate=True,
+            stale_if_error=True,
+        )
+    else:
+        if cache_dir:
+            print("[enrich] requests-cache not installed; page cache disabled", file=sys.stderr)
+        session = requests.Session()
+    session.headers.update(_HEADERS)
+    size = pool_maxsize if pool_maxsize is not None else enrichment_workers()
+    _mount_retrying_adapter(session, pool_maxsize=size, pool_block=True)
+    return session
+
+
+def purge_expired_pages(session: requests.Session) -> None:
+    """Drop expired responses from a `build_session(cache_dir=...)` page cache.
+
+    stale_if_error keeps expired pages around as a fallback, so without a purge
+    the SQLite file (restored and re-saved by CI) only ever grows. Call once at
+    the end of a run; sessions without a cache are left alone.
+    """
+    cache = getattr(session, "cache", None)
+    if cache is None:
+        return
+    try:
+        cache.delete(expired=True)
+    except Exception as e:  # a failed purge must not fail the run
+        print(f"[enrich] cache purge failed err={e}", file=sys.stderr)
+
+
+def _get_page(
+    url: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+    label: str = "",
+) -> Optional[str]:
+    """GET an event page and return its decoded HTML, or None on request/status errors.
+
+    `label` prefixes the debug lines ("content ", "raw-details ") so each
+    enricher's log keeps its own tag.
+    """
+    get = session.get if session is not None else requests.get
+    try:
+        # Read the whole body rather than streaming and aborting once the
+        # subtitle appears: closing a response mid-body discards its pooled
+        # keep-alive connection (a new TCP+TLS handshake for the next page),
+        # and the on-disk page cache stores complete responses anyway.
+        resp = get(url, timeout=timeout, headers=_HEADERS)
     except Exception as e:
-        if debug:
-            print(f"[enrich] request-error url={url} err={e}")
-        return ""
+        if _DEBUG:
+            print(f"[enrich] {label}request-error url={url} err={e}", file=sys.stderr)
+        return None
     try:
         resp.raise_for_status()
     except Exception as e:
+        if _DEBUG:
+            print(f"[enrich] {label}bad-status url={url} code={getattr(resp,'status_code',None)} err={e}", file=sys.stderr)
+        return None
+    return resp.text
+
+
+def _page_fetcher(
+    pages: Dict[str, Optional[str]],
+    parse: Callable[[str, str], str],
+    session: Optional[requests.Session],
+    label: str,
+) -> Callable[[str], str]:
+    """Build a fetch(url) that downloads each page once into `pages` and parses it.
+
+    Sharing one `pages` dict between enrichers means a URL needed for the
+    title, content and raw details is requested once per run; failed fetches
+    are remembered as None so later enrichers don't retry them.
+    """
+    def fetch(url: str) -> str:
+        if url not in pages:
+            pages[url] = _get_page(url, session=session, label=label)
+        html = pages[url]
+        return parse(html, url) if html is not None else ""
+    return fetch
+
+
+def _subtitle_from_html(html: str, url: str = "") -> str:
+    debug = _DEBUG
+    raw = _subtitle_text(html)
+    if raw is None:
         if debug:
-            print(f"[enrich] bad-status url={url} code={getattr(resp,'status_code',None)} err={e}")
-        return ""
-    soup = BeautifulSoup(resp.text, "html.parser")
-    div = soup.find("div", class_="event-subtitle")
-    if not div:
-        if debug:
-            print(f"[enrich] subtitle-missing url={url} length={len(resp.text)}")
+            print(f"[enrich] subtitle-missing url={url} length={len(html)}", file=sys.stderr)
         return ""
-    # get_text with separator to retain spacing, then collapse any runs
-    raw = div.get_text(separator=" ", strip=True)
     normalized = " ".join(raw.split())
     if debug:
-        print(f"[enrich] subtitle-found url={url} len={len(normalized)}")
+        print(f"[enrich] subtitle-found url={url} len={len(normalized)}", file=sys.stderr)
     return normalized
 
 
-def fetch_content_body(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
+def fetch_subtitle(
+    url: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+) -> str:
+    """Fetch a page and return normalized subtitle text.
+
+    Adds a desktop User-Agent to avoid 403 responses and collapses internal
+    whitespace/newlines to single spaces. Pass `session` to reuse pooled
+    connections across calls.
+    """
+    html = _get_page(url, timeout=timeout, session=session)
+    return _subtitle_from_html(html, url) if html is not None else ""
+
+
+def fetch_content_body(
+    url: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+    fmt: Optional[str] = None,
+) -> str:
     """Fetch a page and return main content as text/markdown/html.
 
         Behavior is controlled by ENRICH_CONTENT_FORMAT env var:
@@ -105,55 +433,73 @@ def fetch_content_body(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
 
         Extraction targets a few structures, prioritizing a container matching
         `.events-detail-main` (or `.event-details-main`) that has a header `.details`.
-        Falls back to generic containers otherwise.
+        Falls back to generic containers otherwise. Pass `session` to reuse pooled
+        connections across calls, and `fmt` to skip the env lookup.
         """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "x-wdsoit-bot-bypass": os.getenv("BOT_BYPASS_HEADER_VALUE", "1"),
-    }
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
-    try:
-        resp = requests.get(url, timeout=timeout, headers=headers)
-    except Exception as e:
-        if debug:
-            print(f"[enrich] content request-error url={url} err={e}")
-        return ""
-    try:
-        resp.raise_for_status()
-    except Exception as e:
-        if debug:
-            print(f"[enrich] content bad-status url={url} code={getattr(resp,'status_code',None)} err={e}")
-        return ""
-    soup = BeautifulSoup(resp.text, "html.parser")
+    html = _get_page(url, timeout=timeout, session=session, label="content ")
+    return _content_from_html(html, url, fmt) if html is not None else ""
 
-    # Determine desired output format
+
+def _content_format() -> str:
+    """Content output format from ENRICH_CONTENT_FORMAT ("text" unless markdown/html)."""
     fmt = (os.getenv("ENRICH_CONTENT_FORMAT", "text") or "text").lower()
-    if fmt not in {"text", "markdown", "html"}:
-        fmt = "text"
+    return fmt if fmt in {"text", "markdown", "html"} else "text"
 
-    # Remove scripts/styles regardless of format
-    for bad in soup(["script", "style"]):
-        bad.decompose()
+
+@lru_cache(maxsize=1)
+def _markdownify() -> Optional[Callable[..., str]]:
+    """Optional markdownify converter, imported on first use.
+
+    Only ENRICH_CONTENT_FORMAT=markdown needs it, so other runs skip its import cost.
+    """
+    try:
+        from markdownify import markdownify
+    except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+        return None
+    return markdownify
+
+
+def _content_wrapper_after(header):
+    """First div after `header` by wrapper preference, in a single forward walk.
+
+    Prefers div.tex2jax_process, then div.field__item, then
+    div.field--name-field-ps-body, then any div -- the same choice as a
+    find_next() per class, without rescanning the rest of the page each time.
+    """
+    found: Dict[str, object] = {}
+    first_div = None
+    for div in header.find_all_next("div"):
+        if first_div is None:
+            first_div = div
+        classes = div.get("class") or ()
+        if _CONTENT_WRAPPER_CLASSES[0] in classes:
+            return div
+        for cls in _CONTENT_WRAPPER_CLASSES[1:]:
+            if cls in classes:
+                found.setdefault(cls, div)
+    for cls in _CONTENT_WRAPPER_CLASSES[1:]:
+        if cls in found:
+            return found[cls]
+    return first_div
+
+
+def _content_from_html(html: str, url: str = "", fmt: Optional[str] = None) -> str:
+    debug = _DEBUG
+    soup = BeautifulSoup(html, _HTML_PARSER)
+
+    # Determine desired output format
+    if fmt is None:
+        fmt = _content_format()
 
     # 1) Preferred structure: details within events-detail-main
-    container = soup.select_one("div.events-detail-main") or soup.select_one(
-        "div.event-details-main"
-    )
+    container = _PRIMARY_DETAILS_SEL.select_one(soup) or _ALT_DETAILS_SEL.select_one(soup)
     fragment = None
     if container:
-        header = container.select_one(".details")
+        header = _DETAILS_HEADER_SEL.select_one(container)
         # The actual body is typically within the next significant div
         if header:
             # Look for a specific content wrapper after the header
-            specific = (
-                header.find_next("div", class_="tex2jax_process")
-                or header.find_next("div", class_="field__item")
-                or header.find_next("div", class_="field--name-field-ps-body")
-                or header.find_next("div")
-            )
-            fragment = specific
+            fragment = _content_wrapper_after(header)
         else:
             # Fallback to container itself
             fragment = container
@@ -170,14 +516,20 @@ def fetch_content_body(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
 
     if fragment is None:
         if debug:
-            print(f"[enrich] content-missing url={url}")
+            print(f"[enrich] content-missing url={url}", file=sys.stderr)
         return ""
 
+    # Remove scripts/styles regardless of format. Only the chosen fragment is
+    # serialized, so the rest of the page is left as-is instead of rewritten.
+    for bad in fragment(["script", "style"]):
+        bad.decompose()
+
     # Serializer
     def _to_text(el) -> str:
         # keep paragraph separation, then collapse excessive blank lines
         raw = el.get_text(separator="\n\n", strip=True)
-        # Normalize newlines and spaces
+        # Normalize newlines and spaces. str.split()/join run in C and beat
+        # whitespace regexes here (re.sub is ~4x slower on long bodies).
         lines = [" ".join(line.split()) for line in raw.splitlines()]
         # Collapse consecutive blank lines to single
         out_lines = []
@@ -192,9 +544,10 @@ def fetch_content_body(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
 
     def _to_markdown(el) -> str:
         html = str(el)
-        if _md is not None:
+        convert = _markdownify()
+        if convert is not None:
             try:
-                md = _md(
+                md = convert(
                     html,
                     heading_style="ATX",
                     strip=[],
@@ -222,7 +575,7 @@ def fetch_content_body(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
         # Return inner HTML of the fragment
         # Avoid returning the wrapper tag; focus on its contents
         try:
-            return "".join(str(c) for c in el.contents).strip()
+            return el.decode_contents().strip()
         except Exception:
             return str(el)
 
@@ -234,204 +587,253 @@ def fetch_content_body(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
         body = _to_text(fragment)
 
     if debug:
-        print(f"[enrich] content-found url={url} fmt={fmt} len={len(body)}")
+        print(f"[enrich] content-found url={url} fmt={fmt} len={len(body)}", file=sys.stderr)
     return body
 
 
-def fetch_raw_details_html(url: str, timeout: int = DEFAULT_TIMEOUT) -> str:
+def fetch_raw_details_html(
+    url: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+) -> str:
     """Fetch a page and return inner HTML of <div class="events-detail-main">.
 
     Falls back to <div class="event-details-main"> if the primary class is not found.
-    Returns an empty string if neither is present or on error.
+    Returns an empty string if neither is present or on error. Pass `session`
+    to reuse pooled connections across calls.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "x-wdsoit-bot-bypass": os.getenv("BOT_BYPASS_HEADER_VALUE", "1"),
-    }
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
-    try:
-        resp = requests.get(url, timeout=timeout, headers=headers)
-        resp.raise_for_status()
-    except Exception as e:
-        if debug:
-            print(f"[enrich] raw-details request-error url={url} err={e}")
-        return ""
-    soup = BeautifulSoup(resp.text, "html.parser")
-    container = soup.select_one("div.events-detail-main") or soup.select_one("div.event-details-main")
+    html = _get_page(url, timeout=timeout, session=session, label="raw-details ")
+    return _raw_details_from_html(html, url) if html is not None else ""
+
+
+def _raw_details_from_html(html: str, url: str = "") -> str:
+    debug = _DEBUG
+    container = None
+    # Plain substring scan first: pages without either class are never parsed.
+    if "events-detail-main" in html or "event-details-main" in html:
+        # Only the details containers are built into the tree; the rest of the page is skipped.
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_DETAILS_STRAINER)
+        container = _PRIMARY_DETAILS_SEL.select_one(soup) or _ALT_DETAILS_SEL.select_one(soup)
     if not container:
         if debug:
-            print(f"[enrich] raw-details missing container url={url}")
+            print(f"[enrich] raw-details missing container url={url}", file=sys.stderr)
         return ""
     try:
-        html = "".join(str(c) for c in container.contents).strip()
+        inner = container.decode_contents().strip()
     except Exception:
-        html = str(container)
+        inner = str(container)
     if debug:
-        print(f"[enrich] raw-details found url={url} len={len(html)}")
-    return html
+        print(f"[enrich] raw-details found url={url} len={len(inner)}", file=sys.stderr)
+    return inner
 
 
-def extract_abstract_from_raw_details(raw_html: str) -> str:
-    """Extract abstract content from raw event details HTML.
+@lru_cache(maxsize=32)
+def _details_soup(raw_html: str) -> BeautifulSoup:
+    """Parse rawEventDetails once for both the abstract and the bio lookup.
 
-    Looks for content following "Abstract:" or <h*>Abstract</h*> headers,
-    up to the end of the enclosing div or the next header.
+    The extractors only read the tree, so consecutive calls on the same HTML
+    (as `enrich_raw_extracts` makes per event) can share one soup.
     """
-    if not raw_html or not raw_html.strip():
-        return ""
+    return BeautifulSoup(raw_html, _HTML_PARSER)
 
-    soup = BeautifulSoup(raw_html, "html.parser")
 
-    # Find abstract marker - try different patterns
-    abstract_marker = None
+@lru_cache(maxsize=32)
+def _details_tree(raw_html: str):
+    """lxml counterpart of `_details_soup` (same parser, so the same tree shape)."""
+    return _lxml_etree.fromstring(raw_html, _lxml_parser())
 
-    # Pattern 1: Look for "Abstract:" text (handles both "Abstract:" and "<strong>Abstract</strong>:")
-    # First try to find exact "Abstract:" in text nodes
-    for element in soup.find_all(string=lambda text: text and "Abstract:" in text):
-        if "Abstract:" in element.strip():
-            abstract_marker = element.parent
-            break
 
-    # If not found, look for "Abstract" followed by ":" (possibly separated by HTML tags)
-    if not abstract_marker:
-        for element in soup.find_all(string=lambda text: text and "Abstract" in text.strip()):
-            # Check if this element contains "Abstract" (case insensitive)
-            if "abstract" in element.strip().lower():
-                # Find the closest block-level parent that might contain the full "Abstract:" text
-                parent = element.parent
-                while parent and parent.name not in ['p', 'div', 'section', 'article']:
-                    parent = parent.parent
-                
-                if parent:
-                    # Get all text from the parent element
-                    parent_text = parent.get_text(strip=True)
-                    if "abstract:" in parent_text.lower():
-                        abstract_marker = parent
-                        break
+def _string_container(el) -> Optional[str]:
+    """Nearest enclosing script/style/template/rt/rp tag of `el` (inclusive), if any."""
+    for node in (el, *el.iterancestors()):
+        if node.tag in _STRING_CONTAINERS:
+            return node.tag
+    return None
 
-    # Pattern 2: Look for header tags containing "Abstract"
-    if not abstract_marker:
-        for header in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            if header.get_text(strip=True).lower() == "abstract":
-                abstract_marker = header
-                break
 
-    if not abstract_marker:
+def _lxml_text(el) -> str:
+    """`Tag.get_text(strip=True)` for an lxml element, following BeautifulSoup's rules."""
+    if not isinstance(el.tag, str):  # comment / processing instruction
+        return ""
+    want = el.tag if el.tag in _STRING_CONTAINERS else None
+    parts: List[str] = []
+
+    def walk(node, container: Optional[str]) -> None:
+        if node.tag in _STRING_CONTAINERS:
+            container = node.tag
+        if isinstance(node.tag, str) and node.text and container == want:
+            parts.append(node.text.strip())
+        for child in node:
+            walk(child, container)
+            if child.tail and container == want:
+                parts.append(child.tail.strip())
+
+    parent = el.getparent()
+    walk(el, _string_container(parent) if parent is not None else None)
+    return "".join(parts)
+
+
+def _extract_section_lxml(root, label: str) -> str:
+    """`_extract_section` on an lxml tree: XPath marker lookup, same selection rules."""
+    key = label.lower()
+
+    def string_parent(node):
+        # BeautifulSoup's parent of a text node: the owner for .text, the owner's parent for .tail.
+        if isinstance(node, str):
+            owner = node.getparent()
+            return owner.getparent() if node.is_tail else owner
+        return node.getparent()
+
+    marker = None
+    # Pattern 1: a text node containing "<label>:"
+    hits = _MARKER_NODES_XPATH(root, needle=f"{label}:")
+    if hits:
+        # A comment lxml places outside <html> has no parent; BeautifulSoup's
+        # parent there is the document itself.
+        marker = string_parent(hits[0])
+        if marker is None:
+            marker = root
+    # ... or the label with the colon in a sibling node of its block parent
+    if marker is None:
+        for node in _MARKER_NODES_XPATH(root, needle=label):
+            parent = string_parent(node)
+            while parent is not None and parent.tag not in _BLOCK_TAGS:
+                parent = parent.getparent()
+            if parent is not None and f"{key}:" in _lxml_text(parent).lower():
+                marker = parent
+                break
+    # Pattern 2: a header whose whole text is the label
+    if marker is None:
+        marker = next((h for h in _HEADINGS_XPATH(root) if _lxml_text(h).lower() == key), None)
+    if marker is None:
         return ""
 
-    # Extract content from abstract marker until next header or end
-    content_parts = []
-
-    # Start from the element right after the marker
-    if abstract_marker.name and abstract_marker.name.startswith('h'):
-        # For header markers, start from next sibling
-        current = abstract_marker.next_sibling
-    else:
-        # For text markers like "Abstract:", extract from the same element
-        text_content = abstract_marker.get_text(strip=True)
-        if "abstract:" in text_content.lower():
-            # Extract text after "Abstract:"
-            lower_text = text_content.lower()
-            abstract_pos = lower_text.find("abstract:")
-            if abstract_pos != -1:
-                after_marker = text_content[abstract_pos + 9:].strip()  # 9 = len("abstract:")
-                if after_marker:
-                    content_parts.append(after_marker)
-        # For colon markers, don't continue with siblings since content is in same element
-        current = None
-
-    # Collect content until we hit another header
-    while current:
-        # Stop if we hit any header
-        if hasattr(current, 'name') and current.name and current.name.startswith('h'):
-            break
-
-        # Add text content
-        if hasattr(current, 'get_text'):
-            text = current.get_text(strip=True)
+    content_parts: List[str] = []
+    if marker.tag in _HEADER_TAGS:
+        # Header marker: collect following siblings (and text between them) until the next h*
+        parent = marker.getparent()
+        tail_ok = parent is None or _string_container(parent) is None
+        node = marker
+        while True:
+            if node.tail and tail_ok and node.tail.strip():
+                content_parts.append(node.tail.strip())
+            node = node.getnext()
+            if node is None or node.tag in _HEADER_TAGS:
+                break
+            text = _lxml_text(node)
             if text:
                 content_parts.append(text)
-
-        current = current.next_sibling
-
+    else:
+        # Colon marker: the text after "<label>:" within the same element
+        text_content = _lxml_text(marker)
+        pos = text_content.lower().find(f"{key}:")
+        if pos != -1:
+            after_marker = text_content[pos + len(key) + 1:].strip()
+            if after_marker:
+                content_parts.append(after_marker)
     return " ".join(content_parts).strip()
 
 
-def extract_bio_from_raw_details(raw_html: str) -> str:
-    """Extract bio content from raw event details HTML.
+def _may_mention(raw_html: str, label: str) -> bool:
+    """Cheap pre-parse check: can `raw_html` contain `label` as text at all?
 
-    Looks for content following "Bio:" or <h*>Bio</h*> headers,
-    up to the end of the enclosing div or the next header.
+    Every marker the extractors accept spells out the label (in any case),
+    possibly split by inline tags and whitespace ("Abs <b>tract</b>", which
+    get_text(strip=True) rejoins) or written with character references. So HTML
+    that lacks the label both raw and in its tag-stripped text with all
+    whitespace removed, and has no "&", cannot yield a section and needn't be parsed.
     """
-    if not raw_html or not raw_html.strip():
-        return ""
-
-    soup = BeautifulSoup(raw_html, "html.parser")
+    key = label.lower()
+    lowered = raw_html.lower()
+    if key in lowered:
+        return True
+    text = "".join(_TAG_RE.sub("", lowered).split())
+    return key in text or "&" in text
 
-    # Find bio marker - try different patterns
-    bio_marker = None
 
-    # Pattern 1: Look for "Bio:" text (handles both "Bio:" and "<b>Bio</b>:")
-    # First try to find exact "Bio:" in text nodes
-    for element in soup.find_all(string=lambda text: text and "Bio:" in text):
-        if "Bio:" in element.strip():
-            bio_marker = element.parent
-            break
+def _extract_section(raw_html: str, label: str) -> str:
+    """Extract the text following a "<label>:" or <h*><label></h*> marker.
 
-    # If not found, look for "Bio" followed by ":" (possibly separated by HTML tags)
-    if not bio_marker:
-        for element in soup.find_all(string=lambda text: text and "Bio" in text.strip()):
-            # Check if this element contains "Bio" (case insensitive)
-            if "bio" in element.strip().lower():
-                # Find the closest block-level parent that might contain the full "Bio:" text
+    Collects content up to the end of the enclosing element (colon markers) or
+    the next header (header markers). Uses compiled lxml XPath lookups when
+    lxml is installed and walks a BeautifulSoup tree otherwise.
+    """
+    if not raw_html or not raw_html.strip():
+        return ""
+    if not _may_mention(raw_html, label):
+        return ""
+    if _MARKER_NODES_XPATH is not None:
+        try:
+            root = _details_tree(raw_html)
+        except (ValueError, _lxml_etree.LxmlError):  # e.g. a str with an XML encoding declaration
+            root = None
+        if root is not None:
+            return _extract_section_lxml(root, label)
+
+    soup = _details_soup(raw_html)
+    colon_re, word_re = _SECTION_MARKERS[label]
+    key = label.lower()
+
+    # Find marker - try different patterns
+    marker = None
+
+    # Pattern 1: Look for "<label>:" text (handles both "Bio:" and "<b>Bio</b>:")
+    # First try to find exact "<label>:" in text nodes
+    element = soup.find(string=colon_re)
+    if element is not None:
+        marker = element.parent
+
+    # If not found, look for the label followed by ":" (possibly separated by HTML tags)
+    if not marker:
+        for element in soup.find_all(string=word_re):
+            # Check if this element contains the label (case insensitive)
+            if key in element.strip().lower():
+                # Find the closest block-level parent that might contain the full "<label>:" text
                 parent = element.parent
-                while parent and parent.name not in ['p', 'div', 'section', 'article']:
+                while parent and parent.name not in _BLOCK_TAGS:
                     parent = parent.parent
-                
+
                 if parent:
                     # Get all text from the parent element
                     parent_text = parent.get_text(strip=True)
-                    if "bio:" in parent_text.lower():
-                        bio_marker = parent
+                    if f"{key}:" in parent_text.lower():
+                        marker = parent
                         break
 
-    # Pattern 2: Look for header tags containing "Bio"
-    if not bio_marker:
-        for header in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            if header.get_text(strip=True).lower() == "bio":
-                bio_marker = header
+    # Pattern 2: Look for header tags containing the label
+    if not marker:
+        for header in soup.find_all(_HEADER_TAGS):
+            if header.get_text(strip=True).lower() == key:
+                marker = header
                 break
 
-    if not bio_marker:
+    if not marker:
         return ""
 
-    # Extract content from bio marker until next header or end
+    # Extract content from the marker until next header or end
     content_parts = []
 
     # Start from the element right after the marker
-    if bio_marker.name and bio_marker.name.startswith('h'):
+    if marker.name in _HEADER_TAGS:
         # For header markers, start from next sibling
-        current = bio_marker.next_sibling
+        current = marker.next_sibling
     else:
         # For text markers like "Bio:", extract from the same element
-        text_content = bio_marker.get_text(strip=True)
-        if "bio:" in text_content.lower():
-            # Extract text after "Bio:"
-            lower_text = text_content.lower()
-            bio_pos = lower_text.find("bio:")
-            if bio_pos != -1:
-                after_marker = text_content[bio_pos + 4:].strip()  # 4 = len("bio:")
-                if after_marker:
-                    content_parts.append(after_marker)
+        text_content = marker.get_text(strip=True)
+        lower_text = text_content.lower()
+        pos = lower_text.find(f"{key}:")
+        if pos != -1:
+            # Extract text after "<label>:"
+            after_marker = text_content[pos + len(key) + 1:].strip()
+            if after_marker:
+                content_parts.append(after_marker)
         # For colon markers, don't continue with siblings since content is in same element
         current = None
 
     # Collect content until we hit another header
     while current:
         # Stop if we hit any header
-        if hasattr(current, 'name') and current.name and current.name.startswith('h'):
+        if getattr(current, 'name', None) in _HEADER_TAGS:
             break
 
         # Add text content
@@ -445,16 +847,81 @@ def extract_bio_from_raw_details(raw_html: str) -> str:
     return " ".join(content_parts).strip()
 
 
-def enrich_titles(events: List[Dict], enable: bool, session_cache: Optional[Dict[str, str]] = None, overwrite: bool = False) -> TitleEnrichmentStats:
+def extract_abstract_from_raw_details(raw_html: str) -> str:
+    """Extract abstract content from raw event details HTML.
+
+    Looks for content following "Abstract:" or <h*>Abstract</h*> headers,
+    up to the end of the enclosing div or the next header.
+    """
+    return _extract_section(raw_html, "Abstract")
+
+
+def extract_bio_from_raw_details(raw_html: str) -> str:
+    """Extract bio content from raw event details HTML.
+
+    Looks for content following "Bio:" or <h*>Bio</h*> headers,
+    up to the end of the enclosing div or the next header.
+    """
+    return _extract_section(raw_html, "Bio")
+
+
+def _prefetch(
+    events: List[Dict],
+    cache: Dict[str, str],
+    fetch: Callable[[str], str],
+    workers: Optional[int],
+) -> Tuple[set, Dict[str, Exception]]:
+    """Fetch every unique, uncached event URL into `cache` before the apply pass.
+
+    Pages are fetched concurrently over `workers` threads (default
+    `enrichment_workers()`). Failed fetches are cached as "" so events sharing
+    the URL are not retried. Returns the URLs fetched by this call and the
+    exceptions raised for failed ones, so callers can log/count them once.
+    """
+    to_fetch = [u for u in dict.fromkeys(ev.get("urlRef") or "" for ev in events) if u and u not in cache]
+
+    def _fetch(url: str) -> Tuple[str, Optional[Exception]]:
+        try:
+            return fetch(url), None
+        except Exception as e:
+            return "", e
+
+    workers = enrichment_workers() if workers is None else max(1, workers)
+    if workers > 1 and len(to_fetch) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(to_fetch))) as pool:
+            results = list(pool.map(_fetch, to_fetch))
+    else:
+        results = [_fetch(u) for u in to_fetch]
+    failures: Dict[str, Exception] = {}
+    for url, (value, err) in zip(to_fetch, results):
+        cache[url] = value
+        if err is not None:
+            failures[url] = err
+    return set(to_fetch), failures
+
+
+def enrich_titles(
+    events: List[Dict],
+    enable: bool,
+    session_cache: Optional[Dict[str, str]] = None,
+    overwrite: bool = False,
+    session: Optional[requests.Session] = None,
+    workers: Optional[int] = None,
+    pages: Optional[Dict[str, Optional[str]]] = None,
+) -> TitleEnrichmentStats:
     """Mutate events list in-place adding subtitle to 'title' when available.
 
     Debugging:
-        Set ENRICH_DEBUG=1 to emit detailed skip/update logging to stdout.
+        Set ENRICH_DEBUG=1 to emit detailed skip/update logging to stderr.
 
     Args:
         events: list of event dicts with 'urlRef'.
         enable: if False, no-op.
         session_cache: optional dict for caching url->subtitle.
+        session: optional pooled session (see `build_session`) for page fetches.
+        workers: concurrent page fetches; defaults to `enrichment_workers()`.
+        pages: optional url->HTML dict shared with the other enrichers so each
+            page is downloaded once per run.
     Returns:
         TitleEnrichmentStats summarizing operation.
     """
@@ -462,34 +929,41 @@ def enrich_titles(events: List[Dict], enable: bool, session_cache: Optional[Dict
     if not enable:
         return stats
     cache = session_cache if session_cache is not None else {}
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
+    debug = _DEBUG
+
+    if pages is not None:
+        fetch = _page_fetcher(pages, _subtitle_from_html, session, "")
+    else:
+        fetch = lambda url: fetch_subtitle(url, session=session)  # noqa: E731
+    # Fetch unique uncached URLs up front, then a single pass that only reads the cache.
+    fresh, failures = _prefetch(events, cache, fetch, workers)
+
     for idx, ev in enumerate(events):
         url = ev.get("urlRef") or ""
         if not url:
             stats.skipped_missing_url += 1
             if debug:
-                print(f"[enrich] skip(no-url) event_index={idx}")
+                print(f"[enrich] skip(no-url) event_index={idx}", file=sys.stderr)
             continue
         stats.attempted += 1
-        if url in cache:
-            subtitle = cache[url]
-            if debug:
-                print(f"[enrich] cache-hit url={url} subtitle_len={len(subtitle)}")
-        else:
-            try:
-                subtitle = fetch_subtitle(url)
-            except Exception as e:
-                stats.errors += 1
-                cache[url] = ""
-                if debug:
-                    print(f"[enrich] error fetching url={url} err={e}")
-                continue
-            cache[url] = subtitle
+        subtitle = cache[url]
+        if url in failures:
+            # Count a failed fetch once; later events sharing the URL see the cached miss.
+            err = failures.pop(url)
+            stats.errors += 1
             if debug:
-                print(f"[enrich] fetched url={url} subtitle_len={len(subtitle)}")
+                fresh.discard(url)
+                print(f"[enrich] error fetching url={url} err={err}", file=sys.stderr)
+            continue
+        if debug:
+            if url in fresh:
+                fresh.discard(url)
+                print(f"[enrich] fetched url={url} subtitle_len={len(subtitle)}", file=sys.stderr)
+            else:
+                print(f"[enrich] cache-hit url={url} subtitle_len={len(subtitle)}", file=sys.stderr)
         if not subtitle:
             if debug:
-                print(f"[enrich] skip(no-subtitle) url={url}")
+                print(f"[enrich] skip(no-subtitle) url={url}", file=sys.stderr)
             continue
         existing = ev.get("title")
         # Decide whether to overwrite
@@ -499,24 +973,110 @@ def enrich_titles(events: List[Dict], enable: bool, session_cache: Optional[Dict
             stats.updated += 1
             if debug:
                 action = "overwrote" if (existing and overwrite) else "updated"
-                print(f"[enrich] {action} url={url} new_title_len={len(subtitle)}")
+                print(f"[enrich] {action} url={url} new_title_len={len(subtitle)}", file=sys.stderr)
         else:
             if debug:
                 snippet = str(existing)[:40].replace('\n', ' ')
-                print(f"[enrich] skip(has-title) url={url} existing_snippet={snippet!r} overwrite={overwrite}")
+                print(f"[enrich] skip(has-title) url={url} existing_snippet={snippet!r} overwrite={overwrite}", file=sys.stderr)
     return stats
 
 
 def enrichment_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_TITLES", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_TITLES", "0") in _TRUTHY
 
 
 def enrichment_overwrite_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_OVERWRITE", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_OVERWRITE", "0") in _TRUTHY
+
+
+def enrichment_cache_dir(cli_value: Optional[str] = None) -> Optional[str]:
+    """Directory for the persistent page cache (CLI --cache-dir, env ENRICH_CACHE_DIR)."""
+    if cli_value:
+        return cli_value
+    return os.getenv("ENRICH_CACHE_DIR") or None
+
+
+def enrichment_workers(default: int = 8) -> int:
+    """Number of concurrent page fetches during enrichment (env ENRICH_WORKERS, min 1)."""
+    try:
+        return max(1, int(os.getenv("ENRICH_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+_MISSING_TITLES = frozenset({"", "tbd"})
+
+
+def _title_missing(title_val: object | None) -> bool:
+    """Empty/whitespace or case-insensitive 'TBD' titles count as missing."""
+    return title_val is None or str(title_val).strip().lower() in _MISSING_TITLES
+
+
+# Optional prefix for titles derived from speaker. Supports basic placeholders
+# like {series} sourced from the event dict. Missing keys render as empty string.
+# Special placeholder {a_an} auto-selects "A" or "An" based on next word.
+class _SafeDict(dict):
+    def __missing__(self, key):  # noqa: D401
+        return ""
+
+
+_A_AN_MARKER = "\x00A_AN\x00"
+_A_AN_RE = re.compile(re.escape(_A_AN_MARKER) + r"(?=\s*(\w)|)")
+MAX_PREFIX_LEN = 128  # increased from 64 to allow richer templates
+
+
+def _resolve_a_an(text: str) -> str:
+    """Replace {a_an} markers with 'A' or 'An' based on the following word."""
+    def _replace(m: re.Match) -> str:
+        # Use "An" for vowel sounds (simplified: just vowel letters)
+        first_char = m.group(1)
+        return "An" if first_char and first_char.lower() in "aeiou" else "A"
+    return _A_AN_RE.sub(_replace, text)
+
+
+def _template_fields(tmpl: str) -> Optional[frozenset]:
+    """Top-level event keys referenced by a prefix template (None if unparsable)."""
+    try:
+        names = [name for _, name, _, _ in string.Formatter().parse(tmpl) if name is not None]
+    except ValueError:
+        return None
+    return frozenset(re.split(r"[.\[]", name, maxsplit=1)[0] for name in names)
+
+
+def _render_prefix(tmpl: str, values: Dict) -> str:
+    # Render prefix template with event fields (e.g., {series}) and collapse
+    # whitespace so blanks (like empty series) don't leave doubles.
+    try:
+        rendered = tmpl.format_map(_SafeDict(values))
+    except Exception:
+        # On formatting error, fall back to raw literal
+        rendered = tmpl
+    return _resolve_a_an(" ".join(rendered.split()))
+
+
+def _prefix_parts(prefix: str) -> Tuple[str, str]:
+    """Split a rendered prefix into (speaker prefix, standalone title).
+
+    Both are "" when the prefix is empty or too long to use. The standalone
+    title drops a trailing "by" (case-insensitive) since no name follows.
+    """
+    if not prefix or len(prefix) >= MAX_PREFIX_LEN:
+        return "", ""
+    title = prefix.rstrip()
+    if title.lower().endswith(" by"):
+        title = title[:-3].rstrip()
+    return prefix, title
+
+
+def _last_resort_title(ev: Dict) -> str:
+    """Series-derived title used when no speaker or template can produce one."""
+    series = str(ev.get("series") or "").split(",")[0].strip()
+    text = " ".join(f"{_A_AN_MARKER} {series} Talk".split()) if series else "A Seminar Talk"
+    return _resolve_a_an(text)
 
 
 def fill_title_fallback(events: List[Dict], overwrite: bool = False, include_speaker: bool = True) -> int:
@@ -535,84 +1095,42 @@ def fill_title_fallback(events: List[Dict], overwrite: bool = False, include_spe
 
     Returns the number of events whose title was set.
     """
-    def _is_missing(title_val: object | None) -> bool:
-        if title_val is None:
-            return True
-        s = str(title_val).strip()
-        if not s:
-            return True
-        return s.lower() == "tbd"
-
-    # Optional prefix for titles derived from speaker. Supports basic placeholders
-    # like {series} sourced from the event dict. Missing keys render as empty string.
-    # Special placeholder {a_an} auto-selects "A" or "An" based on next word.
-    class _SafeDict(dict):
-        def __missing__(self, key):  # noqa: D401
-            return ""
-
-    _A_AN_MARKER = "\x00A_AN\x00"
-
-    def _resolve_a_an(text: str) -> str:
-        """Replace {a_an} markers with 'A' or 'An' based on the following word."""
-        import re
-        def _replace(m: re.Match) -> str:
-            rest = text[m.end():]
-            # Find the next word character
-            next_match = re.match(r"\s*(\w)", rest)
-            if next_match:
-                first_char = next_match.group(1).lower()
-                # Use "An" for vowel sounds (simplified: just vowel letters)
-                if first_char in "aeiou":
-                    return "An"
-            return "A"
-        return re.sub(re.escape(_A_AN_MARKER), _replace, text)
-
-    MAX_PREFIX_LEN = 128  # increased from 64 to allow richer templates
     raw_prefix_tmpl = os.getenv("FALLBACK_PREPEND_TEXT", "")
     raw_prefix_tmpl = raw_prefix_tmpl if isinstance(raw_prefix_tmpl, str) else ""
-
-    def _last_resort_title(ev: Dict) -> str:
-        """Series-derived title used when no speaker or template can produce one."""
-        series = str(ev.get("series") or "").split(",")[0].strip()
-        text = " ".join(f"{_A_AN_MARKER} {series} Talk".split()) if series else "A Seminar Talk"
-        return _resolve_a_an(text)
+    # Parse the template once per call: a template without event placeholders
+    # renders to the same prefix for every event, so render it up front.
+    # {a_an} is swapped for a marker first and resolved after rendering.
+    tmpl = raw_prefix_tmpl.replace("{a_an}", _A_AN_MARKER)
+    fields = _template_fields(tmpl) if tmpl else frozenset()
+    # No template at all (the default) is the simplest static case: no prefix.
+    if not tmpl:
+        static_parts: Optional[Tuple[str, str]] = ("", "")
+    elif fields == frozenset():
+        static_parts = _prefix_parts(_render_prefix(tmpl, {}))
+    else:
+        static_parts = None
 
     count = 0
     for ev in events:
         existing = ev.get("title")
-        if not (overwrite or _is_missing(existing)):
+        if not (overwrite or _title_missing(existing)):
             continue
 
-        # Render prefix template with event fields (e.g., {series}) and
-        # collapse whitespace so blanks (like empty series) don't leave doubles.
-        # Handle {a_an} placeholder specially for A/An selection.
-        prefix_rendered = ""
-        if raw_prefix_tmpl:
-            # Preserve {a_an} by replacing with marker before format_map
-            tmpl = raw_prefix_tmpl.replace("{a_an}", _A_AN_MARKER)
-            try:
-                prefix_rendered = tmpl.format_map(_SafeDict(ev))
-            except Exception:
-                # On formatting error, fall back to raw literal
-                prefix_rendered = tmpl
-            prefix_rendered = " ".join(prefix_rendered.split())
-            # Resolve A/An based on next word
-            prefix_rendered = _resolve_a_an(prefix_rendered)
+        if static_parts is not None:
+            prefix, standalone = static_parts
+        else:
+            # fields is None when the template could not be parsed; render
+            # against the whole event so the literal fallback still applies.
+            src = ev if fields is None else {k: ev[k] for k in fields if k in ev}
+            prefix, standalone = _prefix_parts(_render_prefix(tmpl, src))
 
         speaker = ev.get("speaker") if include_speaker else None
-        use_prefix = bool(prefix_rendered) and len(prefix_rendered) < MAX_PREFIX_LEN
         if speaker:
             speaker_str = str(speaker)
-            ev["title"] = (
-                f"{prefix_rendered} {speaker_str}" if use_prefix else speaker_str
-            )
-        elif use_prefix:
-            # No speaker to append: use the template alone, stripping a trailing
-            # "by" (case-insensitive) since no name follows.
-            title = prefix_rendered.rstrip()
-            if title.lower().endswith(" by"):
-                title = title[:-3].rstrip()
-            ev["title"] = title
+            ev["title"] = f"{prefix} {speaker_str}" if prefix else speaker_str
+        elif standalone:
+            # No speaker to append: use the template alone.
+            ev["title"] = standalone
         else:
             # No speaker and no usable template: never leave a title empty.
             ev["title"] = _last_resort_title(ev)
@@ -629,43 +1147,43 @@ def fallback_include_speaker_enabled(cli_flag: bool | None = None) -> bool:
     if cli_flag is not None:
         return cli_flag
     val = os.getenv("FALLBACK_INCLUDE_SPEAKER", "1")
-    return val.lower() in {"1", "true", "yes", "on"}
+    return val.lower() in _TRUTHY
 
 
 def enrichment_content_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_CONTENT", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_CONTENT", "0") in _TRUTHY
 
 
 def enrichment_content_overwrite_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_CONTENT_OVERWRITE", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_CONTENT_OVERWRITE", "0") in _TRUTHY
 
 
 def enrichment_raw_details_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_RAW_DETAILS", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_RAW_DETAILS", "0") in _TRUTHY
 
 
 def enrichment_raw_details_overwrite_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_RAW_DETAILS_OVERWRITE", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_RAW_DETAILS_OVERWRITE", "0") in _TRUTHY
 
 
 def enrichment_raw_extracts_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_RAW_EXTRACTS", "1") in {"1", "true", "yes", "on"}  # enabled by default
+    return os.getenv("ENRICH_RAW_EXTRACTS", "1") in _TRUTHY  # enabled by default
 
 
 def enrichment_raw_extracts_overwrite_enabled(cli_flag: bool) -> bool:
     if cli_flag:
         return True
-    return os.getenv("ENRICH_RAW_EXTRACTS_OVERWRITE", "0") in {"1", "true", "yes", "on"}
+    return os.getenv("ENRICH_RAW_EXTRACTS_OVERWRITE", "0") in _TRUTHY
 
 
 def enrich_content(
@@ -673,44 +1191,54 @@ def enrich_content(
     enable: bool,
     session_cache: Optional[Dict[str, str]] = None,
     overwrite: bool = False,
+    session: Optional[requests.Session] = None,
+    workers: Optional[int] = None,
+    pages: Optional[Dict[str, Optional[str]]] = None,
 ) -> ContentEnrichmentStats:
     """Optionally replace event 'content' with scraped page content.
 
     By default, does not overwrite non-empty content unless `overwrite=True`.
+    Pages are fetched concurrently over `workers` threads (default `enrichment_workers()`),
+    through `session` when given (see `build_session`). Pass the same `pages` dict
+    to every enricher to download each page once per run.
     """
     stats = ContentEnrichmentStats()
     if not enable:
         return stats
     cache = session_cache if session_cache is not None else {}
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
+    debug = _DEBUG
+    fmt = _content_format()  # resolved once per run, not per page
+    if pages is not None:
+        parse = lambda html, url: _content_from_html(html, url, fmt)  # noqa: E731
+        fetch = _page_fetcher(pages, parse, session, "content ")
+    else:
+        fetch = lambda url: fetch_content_body(url, session=session, fmt=fmt)  # noqa: E731
+    fresh, failures = _prefetch(events, cache, fetch, workers)
     for idx, ev in enumerate(events):
         url = ev.get("urlRef") or ""
         if not url:
             stats.skipped_missing_url += 1
             if debug:
-                print(f"[enrich] content skip(no-url) event_index={idx}")
+                print(f"[enrich] content skip(no-url) event_index={idx}", file=sys.stderr)
             continue
         stats.attempted += 1
-        if url in cache:
-            body = cache[url]
+        body = cache[url]
+        if url in failures:
+            err = failures.pop(url)
+            stats.errors += 1
             if debug:
-                print(f"[enrich] content cache-hit url={url} body_len={len(body)}")
-        else:
-            try:
-                body = fetch_content_body(url)
-            except Exception as e:
-                stats.errors += 1
-                body = ""
-                cache[url] = body
-                if debug:
-                    print(f"[enrich] content error fetching url={url} err={e}")
-                continue
-            cache[url] = body
-            if debug:
-                print(f"[enrich] content fetched url={url} body_len={len(body)}")
+                fresh.discard(url)
+                print(f"[enrich] content error fetching url={url} err={err}", file=sys.stderr)
+            continue
+        if debug:
+            if url in fresh:
+                fresh.discard(url)
+                print(f"[enrich] content fetched url={url} body_len={len(body)}", file=sys.stderr)
+            else:
+                print(f"[enrich] content cache-hit url={url} body_len={len(body)}", file=sys.stderr)
         if not body:
             if debug:
-                print(f"[enrich] content skip(no-body) url={url}")
+                print(f"[enrich] content skip(no-body) url={url}", file=sys.stderr)
             continue
         existing = ev.get("content")
         should_overwrite = overwrite or existing is None or str(existing).strip() == ""
@@ -719,10 +1247,10 @@ def enrich_content(
             stats.updated += 1
             if debug:
                 action = "overwrote" if (existing and overwrite) else "updated"
-                print(f"[enrich] content {action} url={url} new_len={len(body)}")
+                print(f"[enrich] content {action} url={url} new_len={len(body)}", file=sys.stderr)
         else:
             if debug:
-                print(f"[enrich] content skip(has-content) url={url} overwrite={overwrite}")
+                print(f"[enrich] content skip(has-content) url={url} overwrite={overwrite}", file=sys.stderr)
     return stats
 
 
@@ -731,44 +1259,52 @@ def enrich_raw_details(
     enable: bool,
     session_cache: Optional[Dict[str, str]] = None,
     overwrite: bool = False,
+    session: Optional[requests.Session] = None,
+    workers: Optional[int] = None,
+    pages: Optional[Dict[str, Optional[str]]] = None,
 ) -> RawDetailsEnrichmentStats:
     """Optionally add 'rawEventDetails' containing inner HTML of events-detail-main.
 
     By default, does not overwrite non-empty values unless `overwrite=True`.
+    Pages are fetched concurrently over `workers` threads (default `enrichment_workers()`),
+    through `session` when given (see `build_session`). Pass the same `pages` dict
+    to every enricher to download each page once per run.
     """
     stats = RawDetailsEnrichmentStats()
     if not enable:
         return stats
     cache = session_cache if session_cache is not None else {}
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
+    debug = _DEBUG
+    if pages is not None:
+        fetch = _page_fetcher(pages, _raw_details_from_html, session, "raw-details ")
+    else:
+        fetch = lambda url: fetch_raw_details_html(url, session=session)  # noqa: E731
+    fresh, failures = _prefetch(events, cache, fetch, workers)
     for idx, ev in enumerate(events):
         url = ev.get("urlRef") or ""
         if not url:
             stats.skipped_missing_url += 1
             if debug:
-                print(f"[enrich] raw-details skip(no-url) event_index={idx}")
+                print(f"[enrich] raw-details skip(no-url) event_index={idx}", file=sys.stderr)
             continue
         stats.attempted += 1
-        if url in cache:
-            html = cache[url]
-            if debug:
-                print(f"[enrich] raw-details cache-hit url={url} len={len(html)}")
-        else:
-            try:
-                html = fetch_raw_details_html(url)
-            except Exception as e:
-                stats.errors += 1
-                html = ""
-                cache[url] = html
-                if debug:
-                    print(f"[enrich] raw-details error fetching url={url} err={e}")
-                continue
-            cache[url] = html
+        html = cache[url]
+        if url in failures:
+            err = failures.pop(url)
+            stats.errors += 1
             if debug:
-                print(f"[enrich] raw-details fetched url={url} len={len(html)}")
+                fresh.discard(url)
+                print(f"[enrich] raw-details error fetching url={url} err={err}", file=sys.stderr)
+            continue
+        if debug:
+            if url in fresh:
+                fresh.discard(url)
+                print(f"[enrich] raw-details fetched url={url} len={len(html)}", file=sys.stderr)
+            else:
+                print(f"[enrich] raw-details cache-hit url={url} len={len(html)}", file=sys.stderr)
         if not html:
             if debug:
-                print(f"[enrich] raw-details skip(no-html) url={url}")
+                print(f"[enrich] raw-details skip(no-html) url={url}", file=sys.stderr)
             continue
         existing = ev.get("rawEventDetails")
         should_overwrite = overwrite or existing is None or str(existing).strip() == ""
@@ -777,10 +1313,10 @@ def enrich_raw_details(
             stats.updated += 1
             if debug:
                 action = "overwrote" if (existing and overwrite) else "updated"
-                print(f"[enrich] raw-details {action} url={url} new_len={len(html)}")
+                print(f"[enrich] raw-details {action} url={url} new_len={len(html)}", file=sys.stderr)
         else:
             if debug:
-                print(f"[enrich] raw-details skip(has-value) url={url} overwrite={overwrite}")
+                print(f"[enrich] raw-details skip(has-value) url={url} overwrite={overwrite}", file=sys.stderr)
     return stats
 
 
@@ -788,6 +1324,7 @@ def enrich_raw_extracts(
     events: List[Dict],
     enable: bool,
     overwrite: bool = False,
+    workers: Optional[int] = None,
 ) -> RawExtractEnrichmentStats:
     """Extract abstract and bio from rawEventDetails into separate fields.
 
@@ -795,53 +1332,81 @@ def enrich_raw_extracts(
     contains valid HTML with abstract/bio sections.
 
     By default, does not overwrite existing values unless `overwrite=True`.
+    Extraction runs on up to `workers` threads (default `enrichment_workers()`,
+    capped at the CPU count); results are applied in event order.
     """
     stats = RawExtractEnrichmentStats()
     if not enable:
         return stats
 
-    debug = os.getenv("ENRICH_DEBUG") in {"1", "true", "yes", "on"}
+    debug = _DEBUG
+
+    def _missing(value: object) -> bool:
+        return value is None or str(value).strip() == ""
 
+    # Select events and fields up front so extraction can run off the main thread.
+    jobs: List[Tuple[int, str, bool, bool]] = []
     for idx, ev in enumerate(events):
         raw_details = ev.get("rawEventDetails") or ""
         if not raw_details or not raw_details.strip():
             stats.skipped_missing_details += 1
             if debug:
-                print(f"[enrich] raw-extract skip(no-details) event_index={idx}")
+                print(f"[enrich] raw-extract skip(no-details) event_index={idx}", file=sys.stderr)
             continue
-
         stats.attempted += 1
-
-        # Extract abstract
-        existing_abstract = ev.get("rawExtractAbstract")
-        should_overwrite_abstract = overwrite or existing_abstract is None or str(existing_abstract).strip() == ""
-        if should_overwrite_abstract:
-            try:
-                abstract = extract_abstract_from_raw_details(raw_details)
-                if abstract:
-                    ev["rawExtractAbstract"] = abstract
-                    stats.updated_abstract += 1
-                    if debug:
-                        print(f"[enrich] raw-extract abstract updated event_index={idx} len={len(abstract)}")
-            except Exception as e:
-                stats.errors += 1
-                if debug:
-                    print(f"[enrich] raw-extract abstract error event_index={idx} err={e}")
-
-        # Extract bio
-        existing_bio = ev.get("rawExtractBio")
-        should_overwrite_bio = overwrite or existing_bio is None or str(existing_bio).strip() == ""
-        if should_overwrite_bio:
+        jobs.append((
+            idx,
+            raw_details,
+            overwrite or _missing(ev.get("rawExtractAbstract")),
+            overwrite or _missing(ev.get("rawExtractBio")),
+        ))
+
+    def _extract(key: Tuple[str, bool, bool]) -> List[Tuple[str, Optional[Exception]]]:
+        raw_details, want_abstract, want_bio = key
+        out = []
+        for wanted, extract in (
+            (want_abstract, extract_abstract_from_raw_details),
+            (want_bio, extract_bio_from_raw_details),
+        ):
+            if not wanted:
+                out.append(("", None))
+                continue
             try:
-                bio = extract_bio_from_raw_details(raw_details)
-                if bio:
-                    ev["rawExtractBio"] = bio
-                    stats.updated_bio += 1
-                    if debug:
-                        print(f"[enrich] raw-extract bio updated event_index={idx} len={len(bio)}")
+                out.append((extract(raw_details), None))
             except Exception as e:
-                stats.errors += 1
-                if debug:
-                    print(f"[enrich] raw-extract bio error event_index={idx} err={e}")
+                out.append(("", e))
+        return out
+
+    # Events in a series often carry identical details; extract each distinct one once.
+    keys = list(dict.fromkeys(job[1:] for job in jobs))
+    workers = min(enrichment_workers() if workers is None else max(1, workers), os.cpu_count() or 1)
+    if workers > 1 and len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(keys))) as pool:
+            results = dict(zip(keys, pool.map(_extract, keys)))
+    else:
+        results = {key: _extract(key) for key in keys}
+
+    for job in jobs:
+        idx = job[0]
+        (abstract, abstract_err), (bio, bio_err) = results[job[1:]]
+        ev = events[idx]
+        if abstract_err is not None:
+            stats.errors += 1
+            if debug:
+                print(f"[enrich] raw-extract abstract error event_index={idx} err={abstract_err}", file=sys.stderr)
+        elif abstract:
+            ev["rawExtractAbstract"] = abstract
+            stats.updated_abstract += 1
+            if debug:
+                print(f"[enrich] raw-extract abstract updated event_index={idx} len={len(abstract)}", file=sys.stderr)
+        if bio_err is not None:
+            stats.errors += 1
+            if debug:
+                print(f"[enrich] raw-extract bio error event_index={idx} err={bio_err}", file=sys.stderr)
+        elif bio:
+            ev["rawExtractBio"] = bio
+            stats.updated_bio += 1
+            if debug:
+                print(f"[enrich] raw-extract bio updated event_index={idx} len={len(bio)}", file=sys.stderr)
 
     return stats
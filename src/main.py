@@ -11,17 +11,27 @@ import argparse
 import json
 import os
 import sys
+import time
 from collections.abc import Iterable
+from contextlib import ExitStack
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
 from ics import Calendar
+try:  # optional C-backed JSON encoder for the events.json write
+    import orjson  # type: ignore
+except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+    orjson = None  # type: ignore
 from .transform import transform_calendar, TransformConfig, load_config
 from .enrich import (
+    build_session,
     enrich_titles,
+    enrichment_cache_dir,
     enrichment_enabled,
     enrichment_overwrite_enabled,
+    enrichment_workers,
     fill_title_fallback,
+    purge_expired_pages,
     fallback_include_speaker_enabled,
     enrich_content,
     enrichment_content_enabled,
@@ -37,6 +47,11 @@ ICS_URL = os.getenv("ICS_URL", "https://example.com/calendar.ics")
 REPO_VARIABLE = os.getenv("REPO_VARIABLE", "default")
 OUTPUT_FILE_ENV = os.getenv("OUTPUT_FILE", "events.json")
 SERIES_EXCLUDE_ENV_KEY = "EXCLUDE_SERIES"
+# Feed download retries: transient gateway/rate-limit statuses and connection
+# errors only (timeouts are not retried); sleeps are fixed and short.
+ICS_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+ICS_ATTEMPTS = 3
+ICS_RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
 
 
 def _split_series_value(raw: str) -> list[str]:
@@ -82,17 +97,24 @@ def _apply_series_exclusions(events: list[dict], exclusions: set[str]) -> tuple[
         return events, 0
     filtered: list[dict] = []
     removed = 0
+    # Events of one series share the same series string; decide each string once.
+    excluded_by_value: dict[str, bool] = {}
     for event in events:
         series_value = event.get("series")
         if isinstance(series_value, str):
-            series_tokens = [s.strip() for s in series_value.split(",") if s.strip()]
+            excluded = excluded_by_value.get(series_value)
+            if excluded is None:
+                excluded = any(
+                    s.strip().casefold() in exclusions for s in series_value.split(",")
+                )
+                excluded_by_value[series_value] = excluded
         elif isinstance(series_value, Iterable):
-            series_tokens = [str(s).strip() for s in series_value if str(s).strip()]
+            excluded = any(str(s).strip().casefold() in exclusions for s in series_value)
         elif series_value is None:
-            series_tokens = []
+            excluded = False
         else:
-            series_tokens = [str(series_value).strip()]
-        if any(token.casefold() in exclusions for token in series_tokens):
+            excluded = str(series_value).strip().casefold() in exclusions
+        if excluded:
             removed += 1
             continue
         filtered.append(event)
@@ -114,11 +136,36 @@ def _resolve_series_exclusions(
     return _collect_series_exclusions(*sources)
 
 
-def fetch_ics(url: str) -> str:
+def _json_bytes(data: object) -> bytes:
+    """Serialize events as 2-space indented UTF-8 JSON (orjson when installed).
+
+    The stdlib fallback keeps non-ASCII characters unescaped so both encoders
+    produce the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_stdout(payload: bytes) -> None:
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(payload.decode("utf-8"))
+        return
+    sys.stdout.flush()  # keep earlier print() output ahead of the raw bytes
+    buffer.write(payload + b"\n")
+    buffer.flush()
+
+
+def fetch_ics(url: str, session: requests.Session | None = None) -> str:
     """Retrieve raw ICS text from URL or local file.
 
     Supports:
-    - http(s) URLs via requests
+    - http(s) URLs via requests (through `session` when given; it must be a
+      plain, uncached session, since the feed must always be fetched fresh and
+      never served from the `build_session(cache_dir=...)` page cache); up to
+      ICS_ATTEMPTS tries on connection errors and ICS_RETRY_STATUSES, with short
+      fixed backoff sleeps
     - file:// URLs by reading from the filesystem
     - bare local paths (absolute or relative)
     """
@@ -131,7 +178,18 @@ def fetch_ics(url: str) -> str:
     if "://" not in url and Path(url).exists():
         return Path(url).read_text(encoding="utf-8")
     # http(s) fallback
-    response = requests.get(url, timeout=30)
+    get = session.get if session is not None else requests.get
+    for attempt in range(ICS_ATTEMPTS):
+        last = attempt == ICS_ATTEMPTS - 1
+        try:
+            response = get(url, timeout=30)
+        except requests.ConnectionError as e:
+            if last or isinstance(e, requests.Timeout):  # ConnectTimeout: don't wait 30 s again
+                raise
+        else:
+            if last or getattr(response, "status_code", None) not in ICS_RETRY_STATUSES:
+                break
+        time.sleep(ICS_RETRY_BACKOFF * 2 ** attempt)
     response.raise_for_status()
     return response.text
 
@@ -170,7 +228,7 @@ def generate_events_json(
     if exclusions:
         data, _ = _apply_series_exclusions(data, exclusions)
     out_path = Path(output_path)
-    out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    out_path.write_bytes(_json_bytes(data))
     return out_path
 
 
@@ -238,6 +296,11 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Extract abstract and bio from rawEventDetails into separate fields (requires raw details enrichment)",
     )
+    p.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Persist fetched event pages under this directory and reuse them across runs (env ENRICH_CACHE_DIR)",
+    )
     p.add_argument(
         "--no-fallback-speaker",
         action="store_true",
@@ -274,46 +337,62 @@ def main(argv: list[str] | None = None) -> int:
                 % (label_text, removed),
                 file=sys.stderr,
             )
+    # Progress lines go to stderr with --print-only so stdout carries only the JSON
+    log = sys.stderr if ns.print_only else sys.stdout
     # Optional enrichment (network I/O) - perform as late as possible just before output
     do_enrich = enrichment_enabled(ns.enrich_titles)
     overwrite = enrichment_overwrite_enabled(ns.enrich_overwrite)
-    if do_enrich:
-        stats = enrich_titles(data, True, overwrite=overwrite)
-        print(
-            f"Enriched titles: attempted={stats.attempted} updated={stats.updated} "
-            f"errors={stats.errors} overwrite={'true' if overwrite else 'false'}"
-        )
-    # Post-process fallback: ensure no blank or 'TBD' titles remain, even when
-    # enrichment is disabled. Fill from FALLBACK_PREPEND_TEXT template,
-    # optionally with speaker; guarantees a series-derived title as last resort.
-    # Only pass cli_flag when --no-fallback-speaker is explicitly used
-    cli_no_speaker = getattr(ns, 'no_fallback_speaker', False)
-    include_speaker = fallback_include_speaker_enabled(
-        cli_flag=False if cli_no_speaker else None
-    )
-    filled = fill_title_fallback(data, overwrite=False, include_speaker=include_speaker)
-    if filled:
-        source = "speaker field" if include_speaker else "template"
-        print(f"Fallback populated {filled} titles from {source}")
-
-    # Optional content enrichment (independent of title enrichment)
     do_content_enrich = enrichment_content_enabled(ns.enrich_content)
     content_overwrite = enrichment_content_overwrite_enabled(ns.enrich_content_overwrite)
-    if do_content_enrich:
-        cstats = enrich_content(data, True, overwrite=content_overwrite)
-        print(
-            f"Enriched content: attempted={cstats.attempted} updated={cstats.updated} "
-            f"errors={cstats.errors} overwrite={'true' if content_overwrite else 'false'}"
-        )
-    # Optional raw details enrichment (independent)
     do_raw_enrich = enrichment_raw_details_enabled(ns.enrich_raw_details)
     raw_overwrite = enrichment_raw_details_overwrite_enabled(ns.enrich_raw_details_overwrite)
-    if do_raw_enrich:
-        rstats = enrich_raw_details(data, True, overwrite=raw_overwrite)
-        print(
-            f"Enriched raw details: attempted={rstats.attempted} updated={rstats.updated} "
-            f"errors={rstats.errors} overwrite={'true' if raw_overwrite else 'false'}"
+    # One pooled (optionally disk-cached) session serves every page-fetching enricher.
+    workers = enrichment_workers()
+    # Closed (pool and cache backend) even if an enrichment phase raises
+    with ExitStack() as stack:
+        session = None
+        pages: dict[str, str | None] = {}  # url -> HTML, shared so each page is downloaded once
+        if do_enrich or do_content_enrich or do_raw_enrich:
+            session = stack.enter_context(
+                build_session(pool_maxsize=workers, cache_dir=enrichment_cache_dir(ns.cache_dir))
+            )
+            stack.callback(purge_expired_pages, session)  # runs before the session closes
+        if do_enrich:
+            stats = enrich_titles(data, True, overwrite=overwrite, session=session, workers=workers, pages=pages)
+            print(
+                f"Enriched titles: attempted={stats.attempted} updated={stats.updated} "
+                f"errors={stats.errors} overwrite={'true' if overwrite else 'false'}",
+                file=log,
+            )
+        # Post-process fallback: ensure no blank or 'TBD' titles remain, even when
+        # enrichment is disabled. Fill from FALLBACK_PREPEND_TEXT template,
+        # optionally with speaker; guarantees a series-derived title as last resort.
+        # Only pass cli_flag when --no-fallback-speaker is explicitly used
+        cli_no_speaker = getattr(ns, 'no_fallback_speaker', False)
+        include_speaker = fallback_include_speaker_enabled(
+            cli_flag=False if cli_no_speaker else None
         )
+        filled = fill_title_fallback(data, overwrite=False, include_speaker=include_speaker)
+        if filled:
+            source = "speaker field" if include_speaker else "template"
+            print(f"Fallback populated {filled} titles from {source}", file=log)
+
+        # Optional content enrichment (independent of title enrichment)
+        if do_content_enrich:
+            cstats = enrich_content(data, True, overwrite=content_overwrite, session=session, workers=workers, pages=pages)
+            print(
+                f"Enriched content: attempted={cstats.attempted} updated={cstats.updated} "
+                f"errors={cstats.errors} overwrite={'true' if content_overwrite else 'false'}",
+                file=log,
+            )
+        # Optional raw details enrichment (independent)
+        if do_raw_enrich:
+            rstats = enrich_raw_details(data, True, overwrite=raw_overwrite, session=session, workers=workers, pages=pages)
+            print(
+                f"Enriched raw details: attempted={rstats.attempted} updated={rstats.updated} "
+                f"errors={rstats.errors} overwrite={'true' if raw_overwrite else 'false'}",
+                file=log,
+            )
 
     # Optional raw extracts enrichment (post-processes rawEventDetails)
     do_extract_enrich = enrichment_raw_extracts_enabled(getattr(ns, 'enrich_raw_extracts', False))
@@ -322,16 +401,17 @@ def main(argv: list[str] | None = None) -> int:
         print(
             f"Enriched raw extracts: attempted={xstats.attempted} "
             f"abstract={xstats.updated_abstract} bio={xstats.updated_bio} "
-            f"errors={xstats.errors}"
+            f"errors={xstats.errors}",
+            file=log,
         )
 
     if ns.limit is not None:
         data = data[: ns.limit]
     if ns.print_only:
-        print(json.dumps(data, indent=2))
+        _write_stdout(_json_bytes(data))
         return 0
     out_path = Path(ns.output)
-    out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    out_path.write_bytes(_json_bytes(data))
     print(f"Wrote {out_path} ({len(data)} events)")
     return 0
 
@@ -6,40 +6,55 @@ time/location normalization for calendar events.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Iterable, Any
+from datetime import tzinfo
+from functools import lru_cache
+from typing import Callable, Dict, List, Set, Iterable, Any, Tuple
 import os
 import re
 import json
 from pathlib import Path
 import arrow  # type: ignore
+from arrow.parser import TzinfoParser  # type: ignore
+try:  # optional C-backed JSON parser for config files
+    import orjson  # type: ignore
+except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+    orjson = None  # type: ignore
+
+# Description/speaker escaping patterns, compiled once for all events.
+_UNESCAPED_COMMA_RE = re.compile(r"(?<!\\),")
+_UNESCAPED_SEMICOLON_RE = re.compile(r"(?<!\\);")
+_UNESCAPED_SEPARATOR_RE = re.compile(r"(?<!\\)([,;])")
+
+# Default time_format; format_time renders it with datetime.isoformat (in C).
+_ISO_SECONDS_FORMAT = "YYYY-MM-DDTHH:mm:ss"
+
+# TransformConfig defaults. Never handed out directly: each config gets its
+# own copy via a bound .copy default_factory instead of rebuilding literals.
+_DEFAULT_FIELD_MAPPINGS: Dict[str, str] = {
+    "uid": "guid",
+    "begin": "startTime",
+    "end": "endTime",
+    "url": "urlRef",
+    "categories": "series",
+    "description": "content",
+    "name": "speaker",
+}
+_DEFAULT_MASKED_FIELDS: Set[str] = {"dtstamp", "sequence", "transp", "class"}
+_DEFAULT_PLACEHOLDERS: Dict[str, str] = {
+    "title": "",
+    "cancelled": "",
+    "bannerImage": "",
+    "itemType": "advertisement",
+}
 
 
 @dataclass
 class TransformConfig:
     target_timezone: str = os.getenv("TARGET_TZ", "America/New_York")
-    time_format: str = "YYYY-MM-DDTHH:mm:ss"
-    field_mappings: Dict[str, str] = field(
-        default_factory=lambda: {
-            "uid": "guid",
-            "begin": "startTime",
-            "end": "endTime",
-            "url": "urlRef",
-            "categories": "series",
-            "description": "content",
-            "name": "speaker",
-        }
-    )
-    masked_fields: Set[str] = field(
-        default_factory=lambda: {"dtstamp", "sequence", "transp", "class"}
-    )
-    placeholders: Dict[str, str] = field(
-        default_factory=lambda: {
-            "title": "",
-            "cancelled": "",
-            "bannerImage": "",
-            "itemType": "advertisement",
-        }
-    )
+    time_format: str = _ISO_SECONDS_FORMAT
+    field_mappings: Dict[str, str] = field(default_factory=_DEFAULT_FIELD_MAPPINGS.copy)
+    masked_fields: Set[str] = field(default_factory=_DEFAULT_MASKED_FIELDS.copy)
+    placeholders: Dict[str, str] = field(default_factory=_DEFAULT_PLACEHOLDERS.copy)
     copies: Dict[str, str] = field(default_factory=dict)
     # New configuration knobs
     join_categories: bool = True
@@ -53,91 +68,151 @@ class TransformConfig:
 def clean_text(value: str, collapse: bool = True) -> str:
     if not value:
         return ""
-    value = value.replace("\r", "\n")
     if collapse:
-        value = re.sub(r"\n+", " ", value)
-        value = re.sub(r"\s+", " ", value).strip()
-    return value
+        # One C-level pass: \r and \n runs are whitespace like any other, so
+        # split()/join collapses them along with spaces and tabs.
+        return " ".join(value.split())
+    return value.replace("\r", "\n")
 
 
 def escape_commas(value: str) -> str:
-    return re.sub(r"(?<!\\),", r"\\,", value)
+    return _UNESCAPED_COMMA_RE.sub(r"\\,", value)
 
 
 def escape_semicolons(value: str) -> str:
-    return re.sub(r"(?<!\\);", r"\\;", value)
+    return _UNESCAPED_SEMICOLON_RE.sub(r"\\;", value)
+
+
+def escape_separators(value: str) -> str:
+    """escape_commas(escape_semicolons(value)) in a single regex pass."""
+    return _UNESCAPED_SEPARATOR_RE.sub(r"\\\1", value)
+
+
+@lru_cache(maxsize=1024)
+def _split_location(raw: str) -> Tuple[str, str]:
+    """(detail, name) for a "<room> - <building>" LOCATION; rooms repeat across events."""
+    parts = [p.strip() for p in raw.split("-", 1)]
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return parts[0], ""
 
 
 def parse_location(raw: str | None) -> dict:
     if not raw:
         return {"name": "", "id": "", "detail": ""}
-    parts = [p.strip() for p in raw.split("-", 1)]
-    if len(parts) == 2:
-        detail, name = parts
-    else:
-        detail = parts[0]
-        name = ""
+    # Cached as an immutable tuple; each event still gets its own dict.
+    detail, name = _split_location(raw)
     return {"name": name, "id": "", "detail": detail}
 
 
+@lru_cache(maxsize=8)
+def _tzinfo(name: str) -> tzinfo | None:
+    """Resolve a timezone name once per process; None when arrow can't parse it."""
+    try:
+        return TzinfoParser.parse(name)
+    except Exception:
+        return None
+
+
 def format_time(arrow_dt, cfg: TransformConfig) -> str:
     if arrow_dt is None:
         return ""
+    tz = _tzinfo(cfg.target_timezone)
     try:
-        localized = arrow_dt.to(cfg.target_timezone)
+        localized = arrow_dt.to(tz) if tz is not None else arrow_dt
     except Exception:
         localized = arrow_dt
+    if cfg.time_format == _ISO_SECONDS_FORMAT and isinstance(localized, arrow.Arrow):
+        return localized.naive.isoformat(timespec="seconds")
     return localized.format(cfg.time_format)
 
 
-def transform_event(event, cfg: TransformConfig) -> dict:
+def _map_time(val, cfg: TransformConfig) -> object:
+    return format_time(val, cfg)
+
+
+def _map_description(val, cfg: TransformConfig) -> object:
+    desc = str(val)
+    if cfg.preserve_description_escapes:
+        desc = escape_separators(desc)
+    rep_mode = (cfg.represent_newlines_as or "space").lower()
+    collapse = cfg.collapse_whitespace_in_description and rep_mode == "space"
+    desc = clean_text(desc, collapse=collapse)
+    if rep_mode == "literal_r":
+        desc = desc.replace("\n", "\\r")
+    elif rep_mode == "newline":
+        # keep newlines
+        pass
+    elif rep_mode == "space":
+        pass
+    else:
+        desc = clean_text(desc, collapse=True)
+    return desc
+
+
+def _map_name(val, cfg: TransformConfig) -> object:
+    return escape_commas(str(val))
+
+
+def _map_categories(val, cfg: TransformConfig) -> object:
+    if isinstance(val, (set, list, tuple)):
+        if cfg.join_categories:
+            return cfg.categories_delimiter.join(sorted(map(str, val)))
+        return next(iter(val), "")
+    return str(val)  # single string
+
+
+def _map_str(val, cfg: TransformConfig) -> object:
+    return str(val)
+
+
+_FIELD_HANDLERS: Dict[str, Callable[[Any, TransformConfig], object]] = {
+    "begin": _map_time,
+    "end": _map_time,
+    "description": _map_description,
+    "name": _map_name,
+    "categories": _map_categories,
+}
+
+FieldPlan = List[Tuple[str, str, Callable[[Any, TransformConfig], object]]]
+
+
+def field_plan(cfg: TransformConfig) -> FieldPlan:
+    """Resolve cfg's field mappings once into (attr, target, handler) steps.
+
+    Masked attributes are dropped here, so per-event work is just the getattr
+    and the handler call. Build it once per calendar and pass it to
+    transform_event; rebuild it if cfg changes.
+    """
+    masked = cfg.masked_fields
+    return [
+        (attr, target, _FIELD_HANDLERS.get(attr, _map_str))
+        for attr, target in cfg.field_mappings.items()
+        if attr not in masked
+    ]
+
+
+def transform_event(event, cfg: TransformConfig, plan: FieldPlan | None = None) -> dict:
     out: Dict[str, object] = {}
 
     # Map core fields
-    for attr, target in cfg.field_mappings.items():
-        if attr in cfg.masked_fields:
-            continue
+    for attr, target, handler in plan if plan is not None else field_plan(cfg):
         val = getattr(event, attr, None)
-        if val is None:
-            continue
-        if attr in {"begin", "end"}:
-            out[target] = format_time(val, cfg)
-        elif attr == "description":
-            desc = str(val)
-            if cfg.preserve_description_escapes:
-                desc = escape_commas(escape_semicolons(desc))
-            rep_mode = (cfg.represent_newlines_as or "space").lower()
-            collapse = cfg.collapse_whitespace_in_description and rep_mode == "space"
-            desc = clean_text(desc, collapse=collapse)
-            if rep_mode == "literal_r":
-                desc = desc.replace("\n", "\\r")
-            elif rep_mode == "newline":
-                # keep newlines
-                pass
-            elif rep_mode == "space":
-                pass
-            else:
-                desc = clean_text(desc, collapse=True)
-            out[target] = desc
-        elif attr == "name":
-            out[target] = escape_commas(str(val))
-        elif attr == "categories":
-            if isinstance(val, (set, list, tuple)):
-                if cfg.join_categories:
-                    out[target] = cfg.categories_delimiter.join(sorted(map(str, val)))
-                else:
-                    out[target] = next(iter(val), "")
-            else:  # single string
-                out[target] = str(val)
-        else:
-            out[target] = str(val)
+        if val is not None:
+            out[target] = handler(val, cfg)
 
     # Location parsing
     out["location"] = parse_location(getattr(event, "location", None))
 
-    # Placeholders
-    for k, v in cfg.placeholders.items():
-        out.setdefault(k, v)
+    # Placeholders fill only fields the event didn't set. Usually none overlap
+    # (title, bannerImage, ... are never mapped), so merge them in one C-level
+    # update; insertion order is the same as the setdefault loop's.
+    placeholders = cfg.placeholders
+    if placeholders.keys().isdisjoint(out):
+        out.update(placeholders)
+    else:
+        for k, v in placeholders.items():
+            out.setdefault(k, v)
 
     # Copy fields
     for new_field, source_field in cfg.copies.items():
@@ -147,9 +222,20 @@ def transform_event(event, cfg: TransformConfig) -> dict:
     return out
 
 
+def _begin_sort_key(event) -> tuple:
+    """Sort by start instant; events without a start come first.
+
+    Plain (flag, float) tuples compare in C, and never mix Arrow with a
+    placeholder value (which raised TypeError for undated events).
+    """
+    begin = getattr(event, "begin", None)
+    return (0, 0.0) if begin is None else (1, begin.timestamp())
+
+
 def transform_calendar(calendar, cfg: TransformConfig | None = None) -> List[dict]:
     cfg = cfg or TransformConfig()
-    events = [transform_event(ev, cfg) for ev in sorted(calendar.events, key=lambda e: e.begin or "")]
+    plan = field_plan(cfg)
+    events = [transform_event(ev, cfg, plan) for ev in sorted(calendar.events, key=_begin_sort_key)]
     return events
 
 
@@ -160,7 +246,9 @@ def load_config(path: str | os.PathLike | None) -> TransformConfig:
     p = Path(path)
     if not p.exists():
         return TransformConfig()
-    data: Dict[str, Any] = json.loads(p.read_text(encoding="utf-8"))
+    # Parse the UTF-8 bytes directly; both parsers raise a json.JSONDecodeError subclass.
+    raw = p.read_bytes()
+    data: Dict[str, Any] = orjson.loads(raw) if orjson is not None else json.loads(raw)
     cfg = TransformConfig()
     for field_name in [
         "target_timezone",
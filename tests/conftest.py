@@ -2,6 +2,22 @@
 import sys
 from pathlib import Path
 
+import pytest
+from ics import Calendar
+
 root = Path(__file__).resolve().parents[1]
 if str(root) not in sys.path:
     sys.path.insert(0, str(root))
+
+
+@pytest.fixture(scope="session")
+def calendar_factory():
+    """Parse ICS text once per session; transform_calendar only reads the result."""
+    cache: dict[str, Calendar] = {}
+
+    def parse(text: str) -> Calendar:
+        if text not in cache:
+            cache[text] = Calendar(text)
+        return cache[text]
+
+    return parse
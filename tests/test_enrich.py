@@ -1,7 +1,9 @@
 import json
 from pathlib import Path
 
-from src.enrich import enrich_titles
+import pytest
+
+from src.enrich import build_session, enrich_titles, enrichment_workers, fetch_subtitle
 
 
 class DummyResp:
@@ -33,4 +35,324 @@ def test_enrich_titles(monkeypatch):
     assert stats.attempted == 2
     # Only first gets updated (second retains existing title)
     assert events[0]["title"].startswith("Optimization and Learning")
-    assert events[1]["title"] == "Existing"
\ No newline at end of file
+    assert events[1]["title"] == "Existing"
+
+
+def test_fetch_subtitle_backends_agree(monkeypatch):
+    html = """
+    <html><body>
+      <div class="event-subtitle extra">Robust <em>Markov</em>
+        Decision   Processes</div>
+    </body></html>
+    """
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001, D401
+        return DummyResp(html)
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    fast = fetch_subtitle("https://example.org/event/1")
+    monkeypatch.setattr("src.enrich.LexborHTMLParser", None)
+    fallback = fetch_subtitle("https://example.org/event/1")
+    assert fast == fallback == "Robust Markov Decision Processes"
+
+
+def test_enrich_titles_uses_passed_session(monkeypatch):
+    html = '<html><body><div class="event-subtitle">Pooled Talk</div></body></html>'
+
+    class FakeSession:
+        def __init__(self):
+            self.urls = []
+
+        def get(self, url, timeout=15, headers=None):  # noqa: ARG002
+            self.urls.append(url)
+            return DummyResp(html)
+
+    def fail_get(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("module-level requests.get should not be used")
+
+    monkeypatch.setattr("src.enrich.requests.get", fail_get)
+    session = FakeSession()
+    events = [
+        {"guid": "1", "urlRef": "https://example.org/event/1", "title": ""},
+        {"guid": "2", "urlRef": "https://example.org/event/1", "title": ""},
+    ]
+    stats = enrich_titles(events, enable=True, session=session)
+    assert stats.updated == 2
+    assert session.urls == ["https://example.org/event/1"]
+    assert all(ev["title"] == "Pooled Talk" for ev in events)
+
+
+def test_enrich_titles_concurrent_fetch_keeps_event_order(monkeypatch):
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        if url.endswith("/bad"):
+            raise RuntimeError("boom")
+        slug = url.rsplit("/", 1)[-1]
+        return DummyResp(f'<div class="event-subtitle">Talk {slug}</div>')
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    events = [
+        {"guid": str(i), "urlRef": f"https://example.org/event/{i}", "title": ""}
+        for i in range(6)
+    ]
+    events.append({"guid": "x", "urlRef": "https://example.org/event/bad", "title": ""})
+    stats = enrich_titles(events, enable=True, workers=4)
+    assert stats.attempted == 7
+    assert stats.updated == 6
+    assert [ev["title"] for ev in events[:6]] == [f"Talk {i}" for i in range(6)]
+    assert events[6]["title"] == ""
+
+
+def test_enrichment_workers_env(monkeypatch):
+    monkeypatch.delenv("ENRICH_WORKERS", raising=False)
+    assert enrichment_workers() == 8
+    monkeypatch.setenv("ENRICH_WORKERS", "3")
+    assert enrichment_workers() == 3
+    monkeypatch.setenv("ENRICH_WORKERS", "0")
+    assert enrichment_workers() == 1
+    monkeypatch.setenv("ENRICH_WORKERS", "many")
+    assert enrichment_workers() == 8
+
+
+def test_build_session_pool_tracks_workers(monkeypatch):
+    monkeypatch.setenv("ENRICH_WORKERS", "5")
+    with build_session() as session:
+        adapter = session.get_adapter("https://example.org/")
+        assert adapter._pool_maxsize == 5
+        assert adapter._pool_block is True
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.read == 0
+        assert 503 in adapter.max_retries.status_forcelist
+        assert 429 in adapter.max_retries.status_forcelist
+        assert "x-wdsoit-bot-bypass" in session.headers
+
+
+def test_build_session_caps_retry_after(monkeypatch):
+    from urllib3 import HTTPResponse
+
+    slept = []
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", slept.append)
+    with build_session() as session:
+        retries = session.get_adapter("https://example.org/").max_retries
+        response = HTTPResponse(body=b"", headers={"Retry-After": "3600"}, status=503)
+        retries = retries.increment(method="GET", url="/", response=response)
+        retries.sleep(response)
+        assert type(retries).__name__ == "_CappedRetry"  # new() keeps the subclass
+    assert slept and max(slept) <= 5
+
+
+def test_build_session_cache_dir_persists_pages(tmp_path):
+    pytest.importorskip("requests_cache")
+    import io
+    from requests.adapters import HTTPAdapter
+    from urllib3 import HTTPResponse
+
+    class CountingAdapter(HTTPAdapter):
+        calls = 0
+
+        def send(self, request, **kwargs):  # noqa: ARG002
+            CountingAdapter.calls += 1
+            raw = HTTPResponse(
+                body=io.BytesIO(b'<div class="event-subtitle">Cached Talk</div>'),
+                headers={"Content-Type": "text/html"},
+                status=200,
+                preload_content=False,
+            )
+            return self.build_response(request, raw)
+
+    url = "https://example.org/event/1"
+    for _ in range(2):  # two "runs" sharing one cache directory
+        with build_session(cache_dir=tmp_path) as session:
+            session.mount("https://", CountingAdapter())
+            assert fetch_subtitle(url, session=session) == "Cached Talk"
+    assert CountingAdapter.calls == 1
+
+
+def test_purge_expired_pages_drops_only_expired_responses(tmp_path):
+    pytest.importorskip("requests_cache")
+    import io
+    from datetime import datetime, timedelta, timezone
+    from requests.adapters import HTTPAdapter
+    from urllib3 import HTTPResponse
+
+    from src.enrich import purge_expired_pages
+
+    class PageAdapter(HTTPAdapter):
+        def send(self, request, **kwargs):  # noqa: ARG002
+            raw = HTTPResponse(
+                body=io.BytesIO(b"<p>page</p>"), headers={"Content-Type": "text/html"}, status=200, preload_content=False
+            )
+            return self.build_response(request, raw)
+
+    with build_session(cache_dir=tmp_path) as session:
+        session.mount("https://", PageAdapter())
+        session.get("https://example.org/old")
+        session.get("https://example.org/fresh")
+        responses = session.cache.responses
+        for key in list(responses.keys()):
+            cached = responses[key]
+            if cached.url.endswith("/old"):
+                cached.expires = datetime.now(timezone.utc) - timedelta(days=1)
+                responses[key] = cached
+        purge_expired_pages(session)
+        assert sorted(r.url for r in responses.values()) == ["https://example.org/fresh"]
+    with build_session() as plain:
+        purge_expired_pages(plain)  # no cache: nothing to do
+
+
+def test_build_session_cache_revalidates_with_etag(tmp_path):
+    pytest.importorskip("requests_cache")
+    import io
+    from requests.adapters import HTTPAdapter
+    from urllib3 import HTTPResponse
+
+    class EtagAdapter(HTTPAdapter):
+        seen = []
+
+        def send(self, request, **kwargs):  # noqa: ARG002
+            EtagAdapter.seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                raw = HTTPResponse(body=io.BytesIO(b""), headers={"ETag": '"v1"'}, status=304, preload_content=False)
+            else:
+                raw = HTTPResponse(
+                    body=io.BytesIO(b'<div class="event-subtitle">Revalidated Talk</div>'),
+                    headers={"Content-Type": "text/html", "ETag": '"v1"'},
+                    status=200,
+                    preload_content=False,
+                )
+            return self.build_response(request, raw)
+
+    url = "https://example.org/event/2"
+    for _ in range(2):
+        with build_session(cache_dir=tmp_path) as session:
+            session.mount("https://", EtagAdapter())
+            assert fetch_subtitle(url, session=session) == "Revalidated Talk"
+    assert EtagAdapter.seen == [None, '"v1"']
+
+
+def test_subtitle_regex_fast_path_matches_parser():
+    from bs4 import BeautifulSoup
+
+    from src.enrich import _subtitle_text
+
+    flat = '<div id="s" class="event-subtitle">Games &amp; <em>Learning</em></div>'
+    nested = '<div class="event-subtitle"><div>Games &amp; Learning</div></div>'
+    assert " ".join(_subtitle_text(flat).split()) == "Games & Learning"
+    assert " ".join(_subtitle_text(nested).split()) == "Games & Learning"
+    assert _subtitle_text('<div class="event-subtitle-alt">No</div>') is None
+    for html in [
+        flat,
+        '<div data-class="event-subtitle">NO</div><div class="event-subtitle">YES</div>',
+        '<div class="event-subtitle" title="a>b">T</div>',
+        '<div class="event-subtitle">A <script>x()</script> B</div>',
+        '<div class="event-subtitle">A <style>p{}</style><!-- note --> B</div>',
+        '<div title="x class=\'event-subtitle\'">NO</div><div class=\'a event-subtitle\'>Q <em title="1>2">R</em></div>',
+        '<div id=s class=event-subtitle>Unquoted</div>',
+    ]:
+        expected = BeautifulSoup(html, "html.parser").find("div", class_="event-subtitle")
+        assert " ".join(_subtitle_text(html).split()) == expected.get_text(separator=" ", strip=True), html
+
+
+def test_subtitle_parsers_skip_script_and_style_text(monkeypatch):
+    from src.enrich import _subtitle_text
+
+    nested = '<div class="event-subtitle"><div>A <script>x()</script></div><style>p{}</style> B</div>'
+    assert " ".join(_subtitle_text(nested).split()) == "A B"
+    monkeypatch.setattr("src.enrich.LexborHTMLParser", None)
+    assert " ".join(_subtitle_text(nested).split()) == "A B"
+    monkeypatch.setattr("src.enrich._SUBTITLE_XPATH", None)
+    assert " ".join(_subtitle_text(nested).split()) == "A B"
+
+
+def test_subtitle_lxml_and_stdlib_fallbacks_agree(monkeypatch):
+    from src.enrich import _subtitle_text
+
+    nested = '<div class="wrap event-subtitle"><div>Games &amp; <em>Learning</em></div></div>'
+    monkeypatch.setattr("src.enrich.LexborHTMLParser", None)
+    via_xpath = _subtitle_text(nested)
+    monkeypatch.setattr("src.enrich._SUBTITLE_XPATH", None)
+    via_stdlib = _subtitle_text(nested)
+    assert " ".join(via_xpath.split()) == " ".join(via_stdlib.split()) == "Games & Learning"
+    assert _subtitle_text('<div class="event-subtitle-alt"><div>No</div></div>') is None
+
+
+def test_enrich_titles_fetches_shared_url_once(monkeypatch):
+    calls = []
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        calls.append(url)
+        if url.endswith("/bad"):
+            raise RuntimeError("boom")
+        return DummyResp('<div class="event-subtitle">Series Talk</div>')
+
+    monkeypatch.setattr("src.enrich.fetch_subtitle", lambda url, session=None: fake_get(url) and "Series Talk")
+    events = [
+        {"urlRef": "https://example.org/series", "title": ""},
+        {"urlRef": "https://example.org/bad", "title": ""},
+        {"urlRef": "https://example.org/series", "title": ""},
+        {"urlRef": "https://example.org/bad", "title": ""},
+    ]
+    stats = enrich_titles(events, enable=True, workers=1)
+    assert sorted(calls) == ["https://example.org/bad", "https://example.org/series"]
+    assert stats.attempted == 4
+    assert stats.updated == 2
+    assert stats.errors == 1
+    assert [ev["title"] for ev in events] == ["Series Talk", "", "Series Talk", ""]
+
+
+def test_build_session_cache_retries_errors_and_serves_stale(tmp_path):
+    pytest.importorskip("requests_cache")
+    import io
+    from requests.adapters import HTTPAdapter
+    from urllib3 import HTTPResponse
+
+    class FlakyAdapter(HTTPAdapter):
+        statuses = [503, 200, 503]
+        seen = []
+
+        def send(self, request, **kwargs):  # noqa: ARG002
+            status = FlakyAdapter.statuses.pop(0)
+            FlakyAdapter.seen.append(status)
+            raw = HTTPResponse(
+                body=io.BytesIO(b'<div class="event-subtitle">Flaky Talk</div>' if status == 200 else b"busy"),
+                headers={"Content-Type": "text/html", "ETag": '"v1"'},
+                status=status,
+                preload_content=False,
+            )
+            return self.build_response(request, raw)
+
+    url = "https://example.org/event/3"
+    results = []
+    for _ in range(3):
+        with build_session(cache_dir=tmp_path) as session:
+            session.mount("https://", FlakyAdapter())
+            results.append(fetch_subtitle(url, session=session))
+    # run 1 fails and is not cached; run 2 fetches; run 3's failed revalidation serves the stored page
+    assert results == ["", "Flaky Talk", "Flaky Talk"]
+    assert FlakyAdapter.seen == [503, 200, 503]
+
+
+def test_enrichers_share_downloaded_pages(monkeypatch):
+    from src.enrich import enrich_content, enrich_raw_details
+
+    html = """
+    <html><body>
+      <div class="event-subtitle">Shared Talk</div>
+      <div class="events-detail-main"><p>Details here.</p></div>
+    </body></html>
+    """
+    calls = []
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        calls.append(url)
+        return DummyResp(html)
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    events = [{"urlRef": "https://example.org/event/1", "title": "", "content": ""}]
+    pages = {}
+    enrich_titles(events, enable=True, pages=pages)
+    enrich_content(events, enable=True, pages=pages)
+    enrich_raw_details(events, enable=True, pages=pages)
+    assert calls == ["https://example.org/event/1"]
+    assert events[0]["title"] == "Shared Talk"
+    assert events[0]["content"] == "Details here."
+    assert events[0]["rawEventDetails"] == "<p>Details here.</p>"
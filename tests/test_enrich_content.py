@@ -122,3 +122,64 @@ def test_enrich_content_fallback_preserves_ics_when_parse_fails(monkeypatch):
     stats2 = enrich_content(events2, enable=True, overwrite=False)
     assert stats2.updated == 0
     assert events2[0]["content"] == ""
+
+
+def test_enrich_content_concurrent_fetch_dedupes_urls(monkeypatch):
+    import threading
+
+    calls = []
+    lock = threading.Lock()
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        with lock:
+            calls.append(url)
+        return DummyResp(f'<div class="event-body">Body for {url[-1]}</div>')
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    events = [{"urlRef": f"https://example.org/event/{i % 3}", "content": ""} for i in range(6)]
+    stats = enrich_content(events, enable=True, workers=4)
+    assert sorted(calls) == [f"https://example.org/event/{i}" for i in range(3)]
+    assert stats.updated == 6
+    assert [ev["content"] for ev in events] == [f"Body for {i % 3}" for i in range(6)]
+
+
+def test_enrich_content_html_strips_scripts_and_styles_from_fragment(monkeypatch):
+    html = (
+        "<html><head><script>var page = 1;</script><style>body {}</style></head><body>"
+        '<div class="event-description"><p>Body</p><script>track()</script>'
+        "<style>p { color: red }</style><noscript>Enable JS</noscript></div>"
+        "</body></html>"
+    )
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        return DummyResp(html)
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    monkeypatch.setenv("ENRICH_CONTENT_FORMAT", "html")
+    events = [{"guid": "s", "urlRef": "https://example.org/event/s", "content": ""}]
+    enrich_content(events, enable=True)
+    assert events[0]["content"] == "<p>Body</p><noscript>Enable JS</noscript>"
+
+
+def test_content_wrapper_after_matches_find_next_preference():
+    from bs4 import BeautifulSoup
+
+    from src.enrich import _content_wrapper_after
+
+    docs = [
+        '<h2 class="details">D</h2><div id="a"><div id="b" class="field__item">'
+        '<div id="c" class="tex2jax_process">x</div></div></div>',
+        '<div id="a" class="tex2jax_process">before</div><h2 class="details">D</h2>'
+        '<div id="b" class="field--name-field-ps-body x"><div id="c" class="field__item">y</div></div>',
+        '<h2 class="details">D</h2><div id="a">plain</div><div id="b" class="field--name-field-ps-body">z</div>',
+        '<h2 class="details">D</h2><p>no divs</p>',
+    ]
+    for doc in docs:
+        header = BeautifulSoup(doc, "html.parser").find(class_="details")
+        expected = (
+            header.find_next("div", class_="tex2jax_process")
+            or header.find_next("div", class_="field__item")
+            or header.find_next("div", class_="field--name-field-ps-body")
+            or header.find_next("div")
+        )
+        assert _content_wrapper_after(header) is expected
@@ -51,3 +51,50 @@ def test_enrich_raw_details_overwrite(monkeypatch):
     stats = enrich_raw_details(events, enable=True, overwrite=True)
     assert stats.updated == 1
     assert "Alt Container" in events[0]["rawEventDetails"]
+
+
+def test_enrich_raw_details_prefers_primary_multiclass_container(monkeypatch):
+    html = """
+    <html><body>
+      <nav><div>menu</div></nav>
+      <div class="event-details-main">legacy</div>
+      <div class="region events-detail-main"><p>Primary</p><div><div>nested</div></div></div>
+    </body></html>
+    """
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        return DummyResp(html)
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    events = [{"guid": "1", "urlRef": "https://example.org/event/1"}]
+    enrich_raw_details(events, enable=True)
+    assert events[0]["rawEventDetails"] == "<p>Primary</p><div><div>nested</div></div>"
+
+
+def test_enrich_raw_details_keeps_top_level_text_escaped(monkeypatch):
+    html = '<div class="events-detail-main">R&amp;D &lt;2025&gt; <p>a &amp; b</p></div>'
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        return DummyResp(html)
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    events = [{"guid": "1", "urlRef": "https://example.org/event/1"}]
+    enrich_raw_details(events, enable=True)
+    assert events[0]["rawEventDetails"] == "R&amp;D &lt;2025&gt; <p>a &amp; b</p>"
+
+
+def test_enrich_raw_details_skips_parse_without_container(monkeypatch):
+    html = "<html><body><div class='event-description'>No details here</div></body></html>"
+
+    def fake_get(url, timeout=15, headers=None):  # noqa: ARG001
+        return DummyResp(html)
+
+    def no_parse(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("page without a details container was parsed")
+
+    monkeypatch.setattr("src.enrich.requests.get", fake_get)
+    monkeypatch.setattr("src.enrich.BeautifulSoup", no_parse)
+    events = [{"guid": "n", "urlRef": "https://example.org/event/n"}]
+    stats = enrich_raw_details(events, enable=True)
+    assert stats.updated == 0
+    assert "rawEventDetails" not in events[0]
@@ -554,4 +554,94 @@ class TestRaceConditionAndRobustness:
         assert "First abstract mention" in abstract_result
         assert "Second abstract mention" not in abstract_result
         assert "First bio mention" in bio_result
-        assert "Second bio mention" not in bio_result
\ No newline at end of file
+        assert "Second bio mention" not in bio_result
+
+
+def test_enrich_raw_extracts_parses_details_once_per_event():
+    from src.enrich import _details_soup, _details_tree
+
+    _details_soup.cache_clear()
+    _details_tree.cache_clear()
+    events = [
+        {"guid": "1", "rawEventDetails": "<h2>Abstract</h2><p>A one.</p><h2>Bio</h2><p>B one.</p>"},
+        {"guid": "2", "rawEventDetails": "<p>Abstract: A two.</p><p>Bio: B two.</p>"},
+    ]
+    stats = enrich_raw_extracts(events, enable=True)
+    assert (stats.updated_abstract, stats.updated_bio) == (2, 2)
+    assert _details_soup.cache_info().misses + _details_tree.cache_info().misses == 2
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<div><h2>Abstract</h2>lead <script>var x</script><p>P<style>s</style>q</p><!-- c --><hr>after</div>",
+        "<p><b>Abstract</b>: after bold</p><p>next</p>",
+        "<div><!-- Abstract: hidden --><p>vis</p></div>",
+        "<section><span>Bio</span><span>:</span> spanned <em>em</em></section>",
+        "<h3>Bio: inline header</h3><p>sibling</p><h4>stop</h4>",
+        "<template><p>Abstract: tpl</p></template><p>Abstract: real</p>",
+        # Leading comments lxml places outside <html> (no parent element)
+        "</h2></li></ul><!-- Bio: c -->Bio:<p>&amp;\u2026",
+        "<!-- Abstract: x -->Abstract: text here<p>more</p>",
+        "<!-- Bio: c --><h2>Bio</h2><p>after header</p>",
+    ],
+)
+def test_section_extract_lxml_matches_soup(monkeypatch, html):
+    pytest.importorskip("lxml")
+    via_lxml = (extract_abstract_from_raw_details(html), extract_bio_from_raw_details(html))
+    monkeypatch.setattr("src.enrich._MARKER_NODES_XPATH", None)
+    via_soup = (extract_abstract_from_raw_details(html), extract_bio_from_raw_details(html))
+    assert via_lxml == via_soup
+
+
+def test_enrich_raw_extracts_threaded_results_keep_event_order():
+    events = [
+        {"guid": str(i), "rawEventDetails": f"<p>Abstract: talk {i}</p><p>Bio: speaker {i}</p>"}
+        for i in range(12)
+    ]
+    stats = enrich_raw_extracts(events, enable=True, workers=4)
+    assert (stats.updated_abstract, stats.updated_bio) == (12, 12)
+    assert [ev["rawExtractAbstract"] for ev in events] == [f"talk {i}" for i in range(12)]
+    assert [ev["rawExtractBio"] for ev in events] == [f"speaker {i}" for i in range(12)]
+
+
+def test_section_extract_continues_past_horizontal_rule():
+    html = "<div><h2>Abstract</h2><p>Part one.</p><hr><p>Part two.</p><h2>Bio</h2><p>Bio text.</p></div>"
+    assert extract_abstract_from_raw_details(html) == "Part one. Part two."
+
+
+def test_section_extract_skips_parse_without_marker_text(monkeypatch):
+    def no_parse(raw_html):  # noqa: ARG001
+        raise AssertionError("details without a marker were parsed")
+
+    monkeypatch.setattr("src.enrich._details_tree", no_parse)
+    monkeypatch.setattr("src.enrich._details_soup", no_parse)
+    html = "<div class='events-detail-main'><p>Room change only.</p></div>"
+    assert extract_abstract_from_raw_details(html) == ""
+    assert extract_bio_from_raw_details(html) == ""
+
+
+def test_section_extract_prefilter_allows_split_and_encoded_labels():
+    assert extract_abstract_from_raw_details("<h2>Abs<b>tract</b></h2><p>Split.</p>") == "Split."
+    assert extract_abstract_from_raw_details("<h2>&#65;bstract</h2><p>Encoded.</p>") == "Encoded."
+    # get_text(strip=True) drops the whitespace between the inline pieces
+    assert extract_abstract_from_raw_details("<h2>Abs <b>tract</b></h2><p>Body.</p>") == "Body."
+    assert extract_abstract_from_raw_details("<h2><span>Abs</span>\n<span>tract</span></h2><p>Body.</p>") == "Body."
+    assert extract_bio_from_raw_details("<h2>Bi <i>o</i></h2><p>Body.</p>") == "Body."
+
+
+def test_enrich_raw_extracts_extracts_duplicate_details_once(monkeypatch):
+    calls = []
+
+    def counting_abstract(raw_html):
+        calls.append(raw_html)
+        return "Shared abstract."
+
+    monkeypatch.setattr("src.enrich.extract_abstract_from_raw_details", counting_abstract)
+    shared = "<p>Abstract: Shared abstract.</p>"
+    events = [{"guid": str(i), "rawEventDetails": shared} for i in range(5)]
+    events.append({"guid": "other", "rawEventDetails": "<p>Abstract: Other.</p>"})
+    stats = enrich_raw_extracts(events, enable=True)
+    assert stats.updated_abstract == 6
+    assert calls.count(shared) == 1 and len(calls) == 2
+    assert all(ev["rawExtractAbstract"] == "Shared abstract." for ev in events)
@@ -1,6 +1,10 @@
 from unittest.mock import patch
 from pathlib import Path
 import json
+
+import pytest
+import requests
+
 from src import main
 
 ICS_SAMPLE = (
@@ -24,6 +28,40 @@ def test_fetch_ics(mock_get):
     assert "BEGIN:VCALENDAR" in result
 
 
+@patch("src.main.requests.get")
+def test_fetch_ics_uses_given_session(mock_get):
+    class Session:
+        def __init__(self):
+            self.urls = []
+
+        def get(self, url, timeout=30):  # noqa: ARG002
+            self.urls.append(url)
+            resp = type("Resp", (), {"text": ICS_SAMPLE, "raise_for_status": lambda self: None})()
+            return resp
+
+    session = Session()
+    assert "BEGIN:VCALENDAR" in main.fetch_ics("https://fake.url/cal.ics", session=session)
+    assert session.urls == ["https://fake.url/cal.ics"]
+    mock_get.assert_not_called()
+
+
+@patch("src.main.time.sleep")
+@patch("src.main.requests.get")
+def test_fetch_ics_retries_transient_statuses_briefly(mock_get, mock_sleep):
+    busy = type("Resp", (), {"status_code": 503, "text": "", "raise_for_status": lambda self: None})()
+    ok = type("Resp", (), {"status_code": 200, "text": ICS_SAMPLE, "raise_for_status": lambda self: None})()
+    mock_get.side_effect = [requests.ConnectionError("reset"), busy, ok]
+    assert "BEGIN:VCALENDAR" in main.fetch_ics("https://fake.url/cal.ics")
+    assert mock_get.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    mock_get.reset_mock(side_effect=True)
+    mock_get.side_effect = requests.ReadTimeout("stalled")
+    with pytest.raises(requests.ReadTimeout):
+        main.fetch_ics("https://fake.url/cal.ics")
+    assert mock_get.call_count == 1  # a read timeout is not retried
+
+
 @patch("src.main.manipulate_data")
 def test_manipulate_data_success(mock_manipulate):
     calendar = main.Calendar(ICS_SAMPLE)
@@ -41,7 +79,7 @@ def test_generate_events_json(mock_fetch):  # noqa: ARG001
         ics_url="unused", repo_variable="var", output_path=out
     )
     assert written.exists()
-    data = json.loads(written.read_text(encoding="utf-8"))
+    data = json.loads(written.read_bytes())
     assert isinstance(data, list)
     assert "guid" in data[0]
     out.unlink()
@@ -54,7 +92,7 @@ def test_generate_events_json_excludes_series_via_env(mock_fetch, monkeypatch, t
     written = main.generate_events_json(
         ics_url="unused", repo_variable="var", output_path=target
     )
-    data = json.loads(written.read_text(encoding="utf-8"))
+    data = json.loads(written.read_bytes())
     assert len(data) == 1
     assert data[0]["series"] == "Keep Me"
 
@@ -72,7 +110,58 @@ def test_main_cli_exclude_series_flag(mock_fetch, monkeypatch, capsys):  # noqa:
     assert exit_code == 0
     captured = capsys.readouterr()
     assert "removed 1 events" in captured.err
-    json_payload = captured.out[captured.out.find("[") :].strip()
-    data = json.loads(json_payload)
+    # stdout carries only the JSON payload; progress lines go to stderr
+    data = json.loads(captured.out)
     assert len(data) == 1
     assert data[0]["series"] == "Keep Me"
+
+
+def test_json_bytes_matches_stdlib_fallback(monkeypatch):
+    data = [{"title": "Café Seminar – Ω", "n": 3, "ok": True, "x": None, "tags": []}]
+    fast = main._json_bytes(data)
+    monkeypatch.setattr(main, "orjson", None)
+    assert main._json_bytes(data) == fast
+    assert json.loads(fast.decode("utf-8")) == data
+
+
+def test_apply_series_exclusions_matches_any_series_token():
+    events = [
+        {"guid": "1", "series": "Keep Me, FPO "},
+        {"guid": "2", "series": "Keep Me"},
+        {"guid": "3", "series": "Keep Me, FPO "},
+        {"guid": "4", "series": ["fpo"]},
+        {"guid": "5", "series": None},
+    ]
+    kept, removed = main._apply_series_exclusions(events, {"fpo"})
+    assert removed == 3
+    assert [ev["guid"] for ev in kept] == ["2", "5"]
+
+
+@patch("src.main.fetch_ics", return_value=ICS_WITH_SERIES)
+def test_main_closes_enrichment_session_when_enricher_raises(mock_fetch, monkeypatch):  # noqa: ARG001
+    sessions = []
+
+    def fake_build_session(pool_maxsize=None, cache_dir=None):  # noqa: ARG001
+        session = requests.Session()
+        session.close = lambda: sessions.append("closed")
+        return session
+
+    def boom(*args, **kwargs):  # noqa: ARG001
+        raise RuntimeError("enrichment failed")
+
+    monkeypatch.setattr(main, "build_session", fake_build_session)
+    monkeypatch.setattr(main, "enrich_titles", boom)
+    with pytest.raises(RuntimeError):
+        main.main(["--ics-url", "unused", "--enrich-titles", "--print-only"])
+    assert sessions == ["closed"]
+
+
+@patch("src.main.fetch_ics", return_value=ICS_WITH_SERIES)
+def test_main_print_only_keeps_enrich_debug_off_stdout(mock_fetch, monkeypatch, capsys):  # noqa: ARG001
+    monkeypatch.delenv("EXCLUDE_SERIES", raising=False)
+    monkeypatch.delenv("ENRICH_CACHE_DIR", raising=False)
+    monkeypatch.setattr("src.enrich._DEBUG", True)
+    assert main.main(["--ics-url", "unused", "--enrich-titles", "--print-only"]) == 0
+    captured = capsys.readouterr()
+    assert len(json.loads(captured.out)) == 2
+    assert "[enrich] skip(no-url)" in captured.err
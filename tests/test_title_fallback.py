@@ -195,3 +195,18 @@ def test_fallback_include_speaker_enabled_cli_override(monkeypatch):
     # CLI says include speaker
     monkeypatch.setenv("FALLBACK_INCLUDE_SPEAKER", "0")
     assert fallback_include_speaker_enabled(cli_flag=True) is True
+
+
+def test_fallback_template_rendered_per_event_fields(monkeypatch):
+    monkeypatch.setenv("FALLBACK_PREPEND_TEXT", "{a_an} {series} Talk by")
+    events = [
+        {"title": "", "speaker": "Ada", "series": "Optimization Seminar"},
+        {"title": "TBD", "speaker": "Bo", "series": "Financial Math"},
+        {"title": "", "speaker": "Cy"},
+    ]
+    assert fill_title_fallback(events) == 3
+    assert [e["title"] for e in events] == [
+        "An Optimization Seminar Talk by Ada",
+        "A Financial Math Talk by Bo",
+        "A Talk by Cy",
+    ]
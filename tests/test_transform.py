@@ -1,11 +1,14 @@
+import pathlib
+
 from src.transform import transform_calendar, TransformConfig
-from ics import Calendar
+
+EXAMPLES_DIR = pathlib.Path(__file__).resolve().parents[1] / "examples"
 
 ICS_EVENT = """BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test Corp//Test Calendar 1.0//EN\nBEGIN:VEVENT\nUID:ps_events:11876:delta:0\nDTSTART:20250908T161500Z\nDTEND:20250908T171500Z\nURL:https://orfe.princeton.edu/events/2025/elynn-chen-new-york-university\nLOCATION:101 - Sherrerd\nSUMMARY:Elynn Chen, New York University\nDESCRIPTION:Abstract: Most learning-and-decision systems assume a single, homogeneous response to actions.\nCATEGORIES:S. S. Wilks Memorial Seminar in Statistics\nDTSTAMP:20250905T185131Z\nEND:VEVENT\nEND:VCALENDAR"""
 
 
-def test_transform_example_event():
-    cal = Calendar(ICS_EVENT)
+def test_transform_example_event(calendar_factory):
+    cal = calendar_factory(ICS_EVENT)
     data = transform_calendar(cal, TransformConfig())
     assert len(data) == 1
     ev = data[0]
@@ -18,32 +21,31 @@ def test_transform_example_event():
     assert "startTime" in ev and "endTime" in ev
 
 
-def test_multiple_categories_join():
+def test_multiple_categories_join(calendar_factory):
     ics_multi = """BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test//Multi Cats//EN\nBEGIN:VEVENT\nUID:abc123\nDTSTART:20250101T120000Z\nDTEND:20250101T130000Z\nSUMMARY:Test\nCATEGORIES:CatA,CatB\nEND:VEVENT\nEND:VCALENDAR"""
-    cal = Calendar(ics_multi)
+    cal = calendar_factory(ics_multi)
     cfg = TransformConfig()
     data = transform_calendar(cal, cfg)
     assert data[0]["series"] in {"CatA,CatB", "CatB,CatA"}
 
 
-def test_description_newline_literal_r():
+def test_description_newline_literal_r(calendar_factory):
     ics_txt = """BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test//EN\nBEGIN:VEVENT\nUID:nl1\nDTSTART:20250101T000000Z\nDTEND:20250101T010000Z\nSUMMARY:Speaker\nDESCRIPTION:Line one\\n Line two\nEND:VEVENT\nEND:VCALENDAR"""
-    cal = Calendar(ics_txt)
+    cal = calendar_factory(ics_txt)
     cfg = TransformConfig(represent_newlines_as="literal_r", preserve_description_escapes=False, collapse_whitespace_in_description=False)
     data = transform_calendar(cal, cfg)
     assert data[0]["content"].count("\\r") >= 1
 
 
-def test_example_files_roundtrip():
+def test_example_files_roundtrip(calendar_factory):
     # Uses the example ICS / expected JSON artifacts committed for validation.
-    import json, pathlib
-    base = pathlib.Path(__file__).resolve().parents[1] / "examples"
-    ics_path = base / "sample_input.example.ics"
-    expected_path = base / "sample_output.expected.json"
+    import json
+    ics_path = EXAMPLES_DIR / "sample_input.example.ics"
+    expected_path = EXAMPLES_DIR / "sample_output.expected.json"
     cfg = TransformConfig(represent_newlines_as="literal_r")
-    with open(ics_path, "r", encoding="utf-8") as f:
-        cal = Calendar(f.read())
+    cal = calendar_factory(ics_path.read_text(encoding="utf-8"))
     produced = transform_calendar(cal, cfg)
+    prod_index = {e["guid"]: e for e in produced}
     with open(expected_path, "r", encoding="utf-8") as f:
         expected = json.load(f)
     # Compare only stable invariant subset of fields per event by guid.
@@ -51,12 +53,12 @@ def test_example_files_roundtrip():
     # Allow produced to contain additional events not yet listed in expected sample.
     core_fields = ["guid", "startTime", "endTime", "urlRef", "location", "series", "speaker"]
     for guid, ref in exp_index.items():
-        match = next((e for e in produced if e["guid"] == guid), None)
+        match = prod_index.get(guid)
         assert match, f"Expected guid {guid} not found in produced output"
         for field in core_fields:
             if field == "series":
-                got_series = set((match.get(field) or "").split(","))
-                exp_series = set((ref.get(field) or "").split(","))
+                got_series = tuple(sorted((match.get(field) or "").split(",")))
+                exp_series = tuple(sorted((ref.get(field) or "").split(",")))
                 assert got_series == exp_series, f"Mismatch series guid={guid}"
             elif field == "location":
                 # Compare subfields ignoring potential swap of name/detail heuristics
@@ -67,4 +69,70 @@ def test_example_files_roundtrip():
                 swapped = got_loc.get("name") == exp_loc.get("detail") and got_loc.get("detail") == exp_loc.get("name")
                 assert same or swapped, f"Location mismatch guid={guid}: got={got_loc} expected={exp_loc}"
             else:
-                assert match.get(field) == ref.get(field), f"Mismatch field={field} guid={guid}"
\ No newline at end of file
+                assert match.get(field) == ref.get(field), f"Mismatch field={field} guid={guid}"
+
+
+def test_format_time_converts_and_tolerates_bad_timezone():
+    import arrow
+
+    from src.transform import format_time
+
+    dt = arrow.get("2025-09-08T16:15:00+00:00")
+    assert format_time(dt, TransformConfig(target_timezone="America/New_York")) == "2025-09-08T12:15:00"
+    # An unparsable zone leaves the time unconverted instead of failing the event
+    assert format_time(dt, TransformConfig(target_timezone="Not/AZone")) == "2025-09-08T16:15:00"
+    # Non-default formats still go through arrow's formatter
+    assert format_time(dt, TransformConfig(time_format="YYYY-MM-DD HH:mm ZZ")) == "2025-09-08 12:15 -04:00"
+
+
+def test_description_escaping_and_collapse_single_pass():
+    from src.transform import clean_text, escape_commas, escape_semicolons, escape_separators
+
+    raw = "A, b;\\, c\r\n\r\n  d\t;e"
+    assert escape_separators(raw) == escape_commas(escape_semicolons(raw))
+    assert clean_text(escape_separators(raw)) == r"A\, b\;\, c d \;e"
+    assert clean_text("x\ry", collapse=False) == "x\ny"
+
+
+def test_transform_calendar_sorts_undated_events_first(calendar_factory):
+    ics_txt = (
+        "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test//EN\n"
+        "BEGIN:VEVENT\nUID:late\nDTSTART:20250301T120000Z\nSUMMARY:Late\nEND:VEVENT\n"
+        "BEGIN:VEVENT\nUID:undated\nSUMMARY:Undated\nEND:VEVENT\n"
+        "BEGIN:VEVENT\nUID:early\nDTSTART:20250101T120000-0500\nSUMMARY:Early\nEND:VEVENT\n"
+        "END:VCALENDAR"
+    )
+    data = transform_calendar(calendar_factory(ics_txt), TransformConfig())
+    assert [ev["guid"] for ev in data] == ["undated", "early", "late"]
+
+
+def test_parse_location_returns_independent_dicts():
+    from src.transform import parse_location
+
+    first = parse_location("101 - Sherrerd")
+    first["id"] = "mutated"
+    second = parse_location("101 - Sherrerd")
+    assert second == {"name": "Sherrerd", "id": "", "detail": "101"}
+    assert parse_location("Friend Center") == {"name": "", "id": "", "detail": "Friend Center"}
+
+
+def test_placeholders_fill_missing_fields_without_overriding_mapped_ones(calendar_factory):
+    cfg = TransformConfig(placeholders={"title": "", "speaker": "TBA", "itemType": "advertisement"})
+    data = transform_calendar(calendar_factory(ICS_EVENT), cfg)
+    ev = data[0]
+    assert ev["speaker"].startswith("Elynn Chen")
+    assert ev["title"] == "" and ev["itemType"] == "advertisement"
+    keys = list(ev)
+    assert keys.index("location") < keys.index("title") < keys.index("itemType")
+    default = transform_calendar(calendar_factory(ICS_EVENT), TransformConfig())[0]
+    assert list(default)[-4:] == ["title", "cancelled", "bannerImage", "itemType"]
+
+
+def test_load_config_reads_utf8_json(tmp_path):
+    from src.transform import load_config
+
+    path = tmp_path / "transform_config.json"
+    path.write_text('{"placeholders": {"title": "Séminaire"}, "masked_fields": ["dtstamp"]}', encoding="utf-8")
+    cfg = load_config(path)
+    assert cfg.placeholders == {"title": "Séminaire"}
+    assert cfg.masked_fields == {"dtstamp"}
@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tools import validate_json
+
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "schema" / "events.schema.json"
+
+
+def _event(**overrides):
+    ev = {
+        "guid": "ps_events:1",
+        "startTime": "2025-09-08T12:15:00",
+        "endTime": "2025-09-08T13:15:00",
+        "urlRef": "https://orfe.princeton.edu/events/2025/example",
+        "location": {"name": "Sherrerd", "id": "", "detail": "101"},
+        "title": "Talk",
+        "cancelled": "false",
+        "bannerImage": "",
+        "itemType": "advertisement",
+    }
+    ev.update(overrides)
+    return ev
+
+
+def test_get_validator_reuses_instance_for_equal_schemas():
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    first = validate_json.get_validator(schema)
+    assert validate_json.get_validator(json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))) is first
+
+
+def test_validate_reports_pass_and_fail(tmp_path, capsys):
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps([_event()]), encoding="utf-8")
+    assert validate_json.validate(SCHEMA_PATH, good) == 0
+
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps([_event(startTime="2025-09-08 12:15")]), encoding="utf-8")
+    assert validate_json.validate(SCHEMA_PATH, bad) == 1
+    out = capsys.readouterr().out
+    assert "Validation passed" in out
+    assert "path=$[0].startTime" in out
+
+
+def test_validate_rejects_invalid_schema(tmp_path, capsys):
+    schema = tmp_path / "schema.json"
+    schema.write_text('{"type": 5}', encoding="utf-8")
+    data = tmp_path / "data.json"
+    data.write_text("[]", encoding="utf-8")
+    assert validate_json.validate(schema, data) == 1
+    assert "Invalid JSON schema" in capsys.readouterr().out
+
+
+def test_fast_check_rejection_falls_back_to_full_report(tmp_path, monkeypatch, capsys):
+    class Rejected(Exception):
+        pass
+
+    calls = []
+
+    def fake_compile(schema, use_formats=True, use_default=True):  # noqa: ARG001
+        assert use_formats is False and use_default is False
+
+        def check(data):
+            calls.append(data)
+            raise Rejected("rejected")
+
+        return check
+
+    fake = type("FakeFastJsonSchema", (), {
+        "compile": staticmethod(fake_compile),
+        "JsonSchemaDefinitionException": type("DefinitionError", (Exception,), {}),
+        "JsonSchemaValueException": Rejected,
+    })
+    monkeypatch.setattr(validate_json, "fastjsonschema", fake)
+    monkeypatch.setattr(validate_json, "_FAST_VALIDATORS", {})
+    data = tmp_path / "data.json"
+    data.write_text(json.dumps([_event(guid=5)]), encoding="utf-8")
+    assert validate_json.validate(SCHEMA_PATH, data) == 1
+    assert len(calls) == 1
+    assert "path=$[0].guid" in capsys.readouterr().out
+
+
+def test_validate_caps_report_at_first_errors_by_path(tmp_path, capsys):
+    data = tmp_path / "data.json"
+    data.write_text(json.dumps([_event(guid=i) for i in range(60)][::-1]), encoding="utf-8")
+    assert validate_json.validate(SCHEMA_PATH, data) == 1
+    out = capsys.readouterr().out
+    lines = [line for line in out.splitlines() if line.startswith(" - ")]
+    assert len(lines) == 50
+    assert lines[0].startswith(" - path=$[0].guid") and lines[-1].startswith(" - path=$[49].guid")
+    assert " ... and 10 more errors" in out
+
+
+def test_main_fail_fast_reports_single_error(tmp_path, capsys):
+    data = tmp_path / "data.json"
+    data.write_text(json.dumps([_event(guid=1), _event(guid=2)]), encoding="utf-8")
+    assert validate_json.main(["--schema", str(SCHEMA_PATH), "--data", str(data), "--fail-fast"]) == 1
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith(" - ")]
+    assert lines == [" - path=$[0].guid schema=items/properties/guid/type error=1 is not of type 'string'"]
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps([_event()]), encoding="utf-8")
+    assert validate_json.main(["--schema", str(SCHEMA_PATH), "--data", str(good), "--fail-fast"]) == 0
+
+
+def test_validate_reports_unparsable_data_with_either_parser(tmp_path, monkeypatch, capsys):
+    data = tmp_path / "data.json"
+    data.write_text("[{", encoding="utf-8")
+    assert validate_json.validate(SCHEMA_PATH, data) == 1
+    monkeypatch.setattr(validate_json, "orjson", None)
+    assert validate_json.validate(SCHEMA_PATH, data) == 1
+    assert capsys.readouterr().out.count("Failed to parse JSON data file") == 2
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [_event()],
+        [_event(title="\u00e9", extra="allowed", urlRef="not a uri")],
+        [],
+        [_event(startTime="2025-09-08 12:15")],
+        [_event(title="")],
+        [_event(cancelled=False)],
+        [_event(itemType="event")],
+        [_event(guid=5)],
+        [_event(location={"name": "", "id": "", "detail": "", "room": "1"})],
+        [{k: v for k, v in _event().items() if k != "bannerImage"}],
+        {"events": []},
+    ],
+)
+def test_fast_check_agrees_with_jsonschema(monkeypatch, data):
+    pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr(validate_json, "_FAST_VALIDATORS", {})
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    jsonschema_ok = not list(validate_json.get_validator(schema).iter_errors(data))
+    assert validate_json._passes_fast_check(schema, data) is jsonschema_ok
+    assert validate_json._FAST_VALIDATORS  # the real compiler accepted the events schema
+
+
+def test_fast_check_unsupported_schema_defers_to_jsonschema(monkeypatch):
+    pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr(validate_json, "_FAST_VALIDATORS", {})
+    schema = {"$schema": "http://json-schema.org/draft-07/schema#", "$ref": "#/definitions/missing"}
+    assert validate_json._passes_fast_check(schema, []) is False
+    assert list(validate_json._FAST_VALIDATORS.values()) == [None]
@@ -7,40 +7,138 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import heapq
 import json
 import sys
 from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
 
 from jsonschema import Draft7Validator
-from jsonschema.exceptions import ValidationError
+from jsonschema.exceptions import SchemaError, ValidationError, best_match
+from jsonschema.validators import validator_for
+
+try:
+    import orjson  # optional faster parser
+except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+    orjson = None
+try:
+    import fastjsonschema  # optional compiled pass/fail check
+except (ImportError, ModuleNotFoundError):  # pragma: no cover - optional
+    fastjsonschema = None
+
+# Checked validator instances keyed by the sha256 of the canonical schema text,
+# so library callers validating several files against one schema only build it once.
+_VALIDATORS: dict[str, Any] = {}
+_FAST_VALIDATORS: dict[str, Optional[Callable[[Any], Any]]] = {}
+_MAX_REPORTED_ERRORS = 50
+
+
+def _schema_key(schema: dict) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
 
 
 def _format_error(err: ValidationError) -> str:
-    loc = "$" + "".join(f"[{repr(p)}]" if isinstance(p, int) else f".{p}" for p in err.path)
-    schema_loc = "/".join(str(p) for p in err.schema_path)
-    msg = err.message
-    return f"path={loc} schema={schema_loc} error={msg}"
+    parts = ["$"]
+    parts.extend(f"[{p!r}]" if isinstance(p, int) else f".{p}" for p in err.path)
+    loc = "".join(parts)
+    schema_loc = "/".join(map(str, err.schema_path))
+    return f"path={loc} schema={schema_loc} error={err.message}"
+
 
+def get_validator(schema: dict) -> Any:
+    """Return a schema-checked validator for ``schema``, reusing a cached instance.
 
-def validate(schema_path: Path, data_path: Path) -> int:
+    The validator class follows the schema's ``$schema`` (Draft 7 when absent).
+    Raises ``SchemaError`` if the schema itself is invalid.
+    """
+    key = _schema_key(schema)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        cls = validator_for(schema, default=Draft7Validator)
+        cls.check_schema(schema)
+        validator = _VALIDATORS[key] = cls(schema)
+    return validator
+
+
+def _passes_fast_check(schema: dict, data: Any) -> bool:
+    """True when the compiled fastjsonschema function accepts ``data``.
+
+    Only a pass is trusted: any rejection (or a missing/unsupported compiler)
+    returns False so jsonschema produces the full, ordered error report.
+    """
+    if fastjsonschema is None:
+        return False
+    key = _schema_key(schema)
+    if key not in _FAST_VALIDATORS:
+        try:
+            # Match jsonschema's defaults: no format assertions, no default filling
+            _FAST_VALIDATORS[key] = fastjsonschema.compile(schema, use_formats=False, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            _FAST_VALIDATORS[key] = None
+    check = _FAST_VALIDATORS[key]
+    if check is None:
+        return False
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        check(data)
+    except fastjsonschema.JsonSchemaValueException:
+        return False
+    return True
+
+
+def _first_errors(errors: Iterable[ValidationError], limit: int) -> tuple[list[ValidationError], int]:
+    """Return the ``limit`` errors with the smallest paths (same order as sorted()) and the total count."""
+    total = 0
+
+    def counted() -> Iterable[ValidationError]:
+        nonlocal total
+        for err in errors:
+            total += 1
+            yield err
+
+    top = heapq.nsmallest(limit, counted(), key=lambda e: tuple(e.path))
+    return top, total
+
+
+def _load_json(path: Path) -> Any:
+    # Parse the UTF-8 bytes directly; both parsers raise a json.JSONDecodeError subclass.
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def validate(schema_path: Path, data_path: Path, fail_fast: bool = False) -> int:
+    try:
+        schema = _load_json(schema_path)
     except json.JSONDecodeError as e:
         print(f"Failed to parse JSON schema file '{schema_path}': {e}")
         return 1
     try:
-        data = json.loads(data_path.read_text(encoding="utf-8"))
+        data = _load_json(data_path)
     except json.JSONDecodeError as e:
         print(f"Failed to parse JSON data file '{data_path}': {e}")
         return 1
-    validator = Draft7Validator(schema)
-    errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
+    try:
+        validator = get_validator(schema)
+    except SchemaError as e:
+        print(f"Invalid JSON schema '{schema_path}': {e.message}")
+        return 1
+    if _passes_fast_check(schema, data):
+        errors, total = [], 0
+    elif fail_fast:
+        # Stop at the first violation; best_match only picks the most relevant
+        # sub-error of that one (e.g. inside anyOf/oneOf)
+        first = next(iter(validator.iter_errors(data)), None)
+        errors = [best_match([first])] if first is not None else []
+        total = len(errors)
+    else:
+        # Only the first errors are printed, so keep a bounded heap instead of sorting all of them
+        errors, total = _first_errors(validator.iter_errors(data), _MAX_REPORTED_ERRORS)
     if errors:
         print(f"Validation failed for {data_path} against {schema_path}:")
-        for e in errors[:50]:  # cap output
+        for e in errors:
             print(" -", _format_error(e))
-        if len(errors) > 50:
-            print(f" ... and {len(errors) - 50} more errors")
+        if total > len(errors):
+            print(f" ... and {total - len(errors)} more errors")
         return 1
     print(f"Validation passed: {data_path}")
     return 0
@@ -50,8 +148,13 @@ def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(description="Validate events JSON against schema")
     p.add_argument("--schema", required=True, help="Path to JSON Schema file")
     p.add_argument("--data", required=True, help="Path to events JSON file")
+    p.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first schema violation and report only that error (exit code is unchanged)",
+    )
     ns = p.parse_args(argv)
-    return validate(Path(ns.schema), Path(ns.data))
+    return validate(Path(ns.schema), Path(ns.data), fail_fast=ns.fail_fast)
 
 
 if __name__ == "__main__":